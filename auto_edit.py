@@ -10,10 +10,21 @@ import json
 import subprocess
 import argparse
 import hashlib
+import math
+import mmap
 import shutil
+import tempfile
+import threading
+import time
+import multiprocessing
+import random
+import urllib.request
+import wave
+from contextlib import contextmanager
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import logging
 from datetime import datetime
 
@@ -39,6 +50,7 @@ class EditConfig:
     apply_zoom_effects: bool = True
     add_subtitles: bool = True
     add_subscribe_popup: bool = True
+    popup_reference_height: int = 0  # Frame height the subscribe image is sized for (0 = this video's)
     add_sound_effects: bool = True
     background_music: Optional[str] = None
     background_music_volume: float = 0.15
@@ -50,6 +62,23 @@ class EditConfig:
     generate_metadata: bool = True  # Generate YouTube metadata with AI
     openrouter_api_key: Optional[str] = None  # OpenRouter API key for DeepSeek
     
+    # Performance
+    fuse_chunk_filters: bool = True  # Run all per-chunk effects in a single ffmpeg pass
+    pipe_stages: bool = True  # Otherwise chain one ffmpeg per stage over pipes (no temp files)
+    fuse_finishing: bool = True  # Subtitles, subscribe popup and music in one final encode
+    artifact_cache_mb: int = 4096  # Size cap for cached intermediates (0 = disabled)
+    result_cache_mb: int = 64  # Size cap for cached transcripts and AI metadata (0 = disabled)
+    result_cache_ttl_days: float = 30.0  # Cached transcripts and metadata expire after this
+    checksum_mode: str = "fast"  # "fast" (sampled fingerprint) or "sha256" (full hash)
+    zoom_mode: str = "quality"  # "fast", "curve" or "quality" (see ZOOM_MODES)
+    whisper_model: str = "base"  # Whisper model name ("tiny", "base", "small", ...)
+    transcribe_workers: int = 0  # Parallel Whisper processes (0 = one per core, 1 = single pass)
+    transcribe_during_edit: bool = True  # Transcribe the source alongside chunk processing
+    whisper_server_url: str = "http://127.0.0.1:8765"  # Warm model server (whisper_server.py), "" = off
+    encoding_profile: str = "balanced"  # "ci-fast", "balanced" or "archive" (see ENCODING_PROFILES)
+    cleanup_intermediates: bool = True  # Delete temp files as soon as the next step has consumed them
+    min_free_disk_mb: int = 1024  # Don't start another chunk if it would leave less free space than this
+    
 
 @dataclass
 class ChunkInfo:
@@ -62,14 +91,974 @@ class ChunkInfo:
     output_path: str
     processed: bool = False
     checksum: Optional[str] = None
+    keep: Optional[List[List[float]]] = None  # Source intervals that survive the cuts (chunk-relative)
+    output_duration: Optional[float] = None  # Edited length (the output file is deleted once concatenated)
+
+
+@dataclass
+class MediaInfo:
+    """Everything the editor needs to know about a media file, from one ffprobe call"""
+    path: str
+    duration: float
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    video_codec: Optional[str] = None
+    pix_fmt: Optional[str] = None
+    audio_codec: Optional[str] = None
+    sample_rate: int = 0
+    channels: int = 0
+    video_extradata: Optional[str] = None  # Hash of the codec headers (SPS/PPS for H.264), not in keyframe probes
+    keyframes: Optional[List[float]] = None  # Only filled when requested
+    
+    @property
+    def has_video(self) -> bool:
+        return self.video_codec is not None
+    
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_codec is not None
+
+
+# Probe results keyed by (path, mtime, size); shared by every editor in the process
+_probe_cache: Dict[Tuple[str, float, int], MediaInfo] = {}
+_probe_lock = threading.Lock()
+
+
+def _parse_rate(rate: Optional[str]) -> float:
+    """Parse an ffprobe rational like '30000/1001'"""
+    if not rate or rate in ('0/0', 'N/A'):
+        return 0.0
+    if '/' in rate:
+        num, den = rate.split('/', 1)
+        return float(num) / float(den) if float(den) else 0.0
+    return float(rate)
+
+
+def probe_media(path: str, keyframes: bool = False) -> MediaInfo:
+    """Probe a media file once (JSON output) and memoize the result"""
+    stat = os.stat(path)
+    cache_key = (os.path.abspath(path), stat.st_mtime, stat.st_size)
+    
+    with _probe_lock:
+        cached = _probe_cache.get(cache_key)
+    if cached and (not keyframes or cached.keyframes is not None):
+        return cached
+    
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-show_format',
+        '-show_streams',
+    ]
+    if keyframes:
+        # Packet flags give the keyframe index without decoding anything
+        cmd += ['-show_entries', 'packet=stream_index,pts_time,flags']
+    else:
+        # Codec header hash for the concat check; with a packet scan ffprobe would
+        # also hash every packet of the input
+        cmd += ['-show_data_hash', 'sha256']
+    cmd += ['-of', 'json', path]
+    
+    result = run_process(cmd, text=True)
+    data = json.loads(result.stdout or '{}')
+    
+    streams = data.get('streams', [])
+    video = next((st for st in streams if st.get('codec_type') == 'video'), None)
+    audio = next((st for st in streams if st.get('codec_type') == 'audio'), None)
+    
+    duration = data.get('format', {}).get('duration')
+    if duration in (None, 'N/A'):
+        durations = [float(st['duration']) for st in streams if st.get('duration') not in (None, 'N/A')]
+        duration = max(durations) if durations else 0.0
+    
+    info = MediaInfo(path=path, duration=float(duration))
+    if video:
+        info.width = int(video.get('width', 0))
+        info.height = int(video.get('height', 0))
+        info.fps = _parse_rate(video.get('avg_frame_rate')) or _parse_rate(video.get('r_frame_rate'))
+        info.video_codec = video.get('codec_name')
+        info.pix_fmt = video.get('pix_fmt')
+        info.video_extradata = video.get('extradata_hash')
+    if audio:
+        info.audio_codec = audio.get('codec_name')
+        info.sample_rate = int(audio.get('sample_rate', 0))
+        info.channels = int(audio.get('channels', 0))
+    
+    if keyframes:
+        video_index = video.get('index') if video else None
+        info.keyframes = sorted(
+            float(pkt['pts_time'])
+            for pkt in data.get('packets', [])
+            if pkt.get('stream_index') == video_index
+            and 'K' in pkt.get('flags', '')
+            and pkt.get('pts_time') not in (None, 'N/A')
+        )
+    
+    with _probe_lock:
+        _probe_cache[cache_key] = info
+    return info
+
+
+# Stream parameters every chunk must share so the concat demuxer can stream-copy them
+CONCAT_VIDEO_CODEC = "h264"
+CONCAT_PIX_FMT = "yuv420p"
+CONCAT_FPS = 30
+CONCAT_AUDIO_CODEC = "aac"
+CONCAT_SAMPLE_RATE = 44100
+# Output options that make an encoding stage land on the concat target
+CONCAT_VIDEO_ARGS = ['-pix_fmt', CONCAT_PIX_FMT, '-r', str(CONCAT_FPS)]
+CONCAT_AUDIO_ARGS = ['-ar', str(CONCAT_SAMPLE_RATE)]
+
+
+def concat_compatibility(info: MediaInfo) -> Tuple[bool, bool]:
+    """(video_ok, audio_ok): whether each stream already matches the concat target"""
+    video_ok = (
+        info.video_codec == CONCAT_VIDEO_CODEC
+        and info.pix_fmt == CONCAT_PIX_FMT
+        and abs(info.fps - CONCAT_FPS) < 0.01
+    )
+    audio_ok = (
+        info.audio_codec == CONCAT_AUDIO_CODEC
+        and info.sample_rate == CONCAT_SAMPLE_RATE
+    )
+    return video_ok, audio_ok
+
+
+@dataclass
+class EncodingProfile:
+    """Encoder settings for temp files (intermediate) and the final output (delivery)"""
+    intermediate_video: List[str]
+    intermediate_audio: List[str]
+    delivery_video: List[str]
+    delivery_audio: List[str]
+    disk_factor: float  # Rough peak temp space of a chunk render, per byte of source chunk
+    
+    @property
+    def delivers_intermediate(self) -> bool:
+        """True when intermediates are already delivery quality (no final encode needed)"""
+        return (self.intermediate_video == self.delivery_video
+                and self.intermediate_audio == self.delivery_audio)
+
+
+ENCODING_PROFILES = {
+    # Fastest turnaround for CI: one speed-first setting everywhere, no final encode
+    "ci-fast": EncodingProfile(
+        intermediate_video=['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '23'],
+        intermediate_audio=['-c:a', 'aac', '-b:a', '128k'],
+        delivery_video=['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '23'],
+        delivery_audio=['-c:a', 'aac', '-b:a', '128k'],
+        disk_factor=2.0,
+    ),
+    # Near-lossless, quick intermediates; the real encode happens once at the end
+    "balanced": EncodingProfile(
+        intermediate_video=['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '16'],
+        intermediate_audio=['-c:a', 'aac', '-b:a', '192k'],
+        delivery_video=['-c:v', 'libx264', '-preset', 'medium', '-crf', '23'],
+        delivery_audio=['-c:a', 'aac', '-b:a', '128k'],
+        disk_factor=4.0,
+    ),
+    # Lossless intermediates (large temp files) and a slow, high quality delivery
+    "archive": EncodingProfile(
+        intermediate_video=['-c:v', 'libx264', '-preset', 'ultrafast', '-qp', '0'],
+        intermediate_audio=['-c:a', 'aac', '-b:a', '320k'],
+        delivery_video=['-c:v', 'libx264', '-preset', 'slow', '-crf', '18'],
+        delivery_audio=['-c:a', 'aac', '-b:a', '192k'],
+        disk_factor=20.0,
+    ),
+}
+
+
+# Read size for full-file hashing when mmap isn't available
+HASH_READ_SIZE = 8 * 1024 * 1024
+# Bytes sampled from the head, middle and tail in fast mode
+FINGERPRINT_SAMPLE_SIZE = 1024 * 1024
+
+
+def sha256_file(path: str) -> str:
+    """Full SHA-256 of a file, memory-mapped when possible"""
+    sha256_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256_hash.update(mapped)
+        except (ValueError, OSError):
+            # Empty files and some filesystems can't be mapped
+            f.seek(0)
+            for byte_block in iter(lambda: f.read(HASH_READ_SIZE), b""):
+                sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def _sampled_digest(path: str, with_mtime: bool) -> str:
+    """blake2b of the size (and mtime) plus sampled head/middle/tail bytes"""
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=20)
+    header = f"{stat.st_size}:{stat.st_mtime_ns}" if with_mtime else f"{stat.st_size}"
+    digest.update(header.encode('utf-8'))
+    
+    with open(path, "rb") as f:
+        if stat.st_size <= 3 * FINGERPRINT_SAMPLE_SIZE:
+            digest.update(f.read())
+        else:
+            for offset in (0, stat.st_size // 2, stat.st_size - FINGERPRINT_SAMPLE_SIZE):
+                f.seek(offset)
+                digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+    
+    return digest.hexdigest()
+
+
+def fast_fingerprint(path: str) -> str:
+    """Cheap change-detection fingerprint: size, mtime and sampled head/middle/tail bytes
+    
+    Not a content hash - use sha256_file when integrity matters.
+    """
+    return f"fast:{_sampled_digest(path, with_mtime=True)}"
+
+
+def content_fingerprint(path: str) -> str:
+    """Cheap content key: size and sampled head/middle/tail bytes, without the mtime
+    
+    Survives copies and re-downloads of the same bytes, so it can key caches of
+    results computed from a large input without hashing all of it.
+    """
+    return f"sample:{_sampled_digest(path, with_mtime=False)}"
+
+
+CHECKSUM_MODES = {
+    "fast": fast_fingerprint,
+    "sha256": sha256_file,
+}
+
+
+def file_checksum(path: str, mode: str = "fast") -> str:
+    """Checksum a file with the named mode (see CHECKSUM_MODES)"""
+    if mode not in CHECKSUM_MODES:
+        raise ValueError(f"Unknown checksum mode '{mode}', expected one of {sorted(CHECKSUM_MODES)}")
+    return CHECKSUM_MODES[mode](path)
+
+
+# Audio analysis window and padding kept around each jump cut (seconds)
+AUDIO_ANALYSIS_WINDOW = 0.05
+JUMP_CUT_PADDING = 0.05
+# Seconds kept from a chunk whose every moment would be cut (e.g. one that is all silence)
+SILENT_CHUNK_KEEP = 0.1
+
+
+def analyze_audio_levels(path: str, window: float = AUDIO_ANALYSIS_WINDOW,
+                         sample_rate: int = 16000) -> Dict[str, Any]:
+    """Decode audio once to PCM and compute windowed RMS and peak levels in dB"""
+    import numpy as np
+    
+    cmd = [
+        'ffmpeg',
+        '-i', path,
+        '-vn',
+        '-ac', '1',
+        '-ar', str(sample_rate),
+        '-f', 's16le',
+        'pipe:1'
+    ]
+    result = run_process(cmd)
+    samples = np.frombuffer(result.stdout, dtype='<i2').astype(np.float32) / 32768.0
+    
+    window_size = max(1, int(sample_rate * window))
+    window_count = len(samples) // window_size
+    frames = samples[:window_count * window_size].reshape(window_count, window_size)
+    
+    rms = np.sqrt(np.mean(frames ** 2, axis=1)) if window_count else np.zeros(0)
+    peak = np.max(np.abs(frames), axis=1) if window_count else np.zeros(0)
+    
+    def to_db(values):
+        return np.round(20.0 * np.log10(np.maximum(values, 1e-10)), 2).tolist()
+    
+    return {
+        "window": window,
+        "duration": len(samples) / sample_rate,
+        "rms_db": to_db(rms),
+        "peak_db": to_db(peak)
+    }
+
+
+def quiet_spans(levels_db: List[float], window: float, threshold_db: float,
+                min_duration: float = 0.0) -> List[Tuple[float, float]]:
+    """(start, end) runs of windows below threshold_db lasting at least min_duration"""
+    import numpy as np
+    
+    quiet = np.asarray(levels_db) < threshold_db
+    if not quiet.any():
+        return []
+    
+    # Rising/falling edges of the quiet mask give run boundaries
+    edges = np.diff(np.concatenate(([0], quiet.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    
+    return [
+        (float(start * window), float(end * window))
+        for start, end in zip(starts, ends)
+        if (end - start) * window >= min_duration
+    ]
+
+
+def keep_intervals(cuts: List[Tuple[float, float]], duration: float) -> List[Tuple[float, float]]:
+    """Complement of the (sorted) cut spans within [0, duration]"""
+    keep = []
+    position = 0.0
+    for cut_start, cut_end in cuts:
+        if cut_start > position:
+            keep.append((position, min(cut_start, duration)))
+        position = max(position, cut_end)
+    if position < duration:
+        keep.append((position, duration))
+    return keep
+
+
+def intersect_intervals(a: List[Tuple[float, float]], b: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Intervals covered by both (sorted) interval lists"""
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if end > start:
+            result.append((start, end))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def remap_time(t: float, pieces: List[Tuple[float, float, float, float]], forward: bool = True) -> float:
+    """Map a source time through (src_start, src_end, out_start, out_end) pieces
+    
+    A time inside a cut snaps to the next kept moment (forward) or the last one.
+    """
+    previous_end = 0.0
+    for src_start, src_end, out_start, out_end in pieces:
+        if t < src_start:
+            return out_start if forward else previous_end
+        if t <= src_end:
+            if src_end <= src_start:
+                return out_start
+            return out_start + (t - src_start) * (out_end - out_start) / (src_end - src_start)
+        previous_end = out_end
+    return previous_end
+
+
+def remap_segments(segments: List[Dict[str, Any]],
+                   pieces: List[Tuple[float, float, float, float]]) -> List[Dict[str, Any]]:
+    """Move transcript segments from source to output time, dropping ones that were cut entirely"""
+    remapped = []
+    for seg in segments:
+        start = remap_time(seg["start"], pieces, forward=True)
+        end = remap_time(seg["end"], pieces, forward=False)
+        if end > start:
+            remapped.append({"start": start, "end": end, "text": seg["text"]})
+    return remapped
+
+
+def format_srt_timestamp(seconds: float) -> str:
+    """Convert seconds to SRT timestamp (HH:MM:SS,mmm)"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millis = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def parse_srt_timestamp(stamp: str) -> float:
+    """Convert an SRT timestamp (HH:MM:SS,mmm) to seconds"""
+    hours, minutes, secs = stamp.strip().replace(',', '.').split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + float(secs)
+
+
+def read_srt(path: str) -> List[Dict[str, Any]]:
+    """Load SRT cues as transcript segments ({start, end, text})"""
+    segments = []
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        blocks = f.read().replace('\r\n', '\n').split('\n\n')
+    for block in blocks:
+        lines = block.strip().split('\n')
+        for i, line in enumerate(lines):
+            if '-->' in line:
+                start, end = line.split('-->')
+                segments.append({
+                    "start": parse_srt_timestamp(start),
+                    "end": parse_srt_timestamp(end.split()[0]),
+                    "text": '\n'.join(lines[i + 1:])
+                })
+                break
+    return segments
+
+
+def write_srt(segments: List[Dict[str, Any]], path: str):
+    """Save transcript segments as SRT"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, segment in enumerate(segments, start=1):
+            start = format_srt_timestamp(segment['start'])
+            end = format_srt_timestamp(segment['end'])
+            f.write(f"{i}\n{start} --> {end}\n{segment['text']}\n\n")
+
+
+# Loudness target of the audio enhancement (EBU R128 style, YouTube friendly)
+LOUDNORM_TARGET = {"I": -16.0, "TP": -1.5, "LRA": 11.0}
+
+
+# Zoom engines, cheapest first:
+#   fast    - zoompan's own crop/scale, no interpolation pass
+#   curve   - zoom factor precomputed per frame, drives crop+scale through sendcmd
+#   quality - zoompan followed by minterpolate motion interpolation
+ZOOM_MODES = ("fast", "curve", "quality")
+ZOOM_FPS = 30
+
+
+def breathing_zoom(t: float) -> float:
+    """Zoom factor at time t for the "breathing" effect (same curve as the zoompan expression)"""
+    wave = math.sin(t * math.pi / 4)
+    if t % 8 <= 4:
+        return min(1.15, 1 + 0.15 * wave)
+    return max(1.0, 1.15 - 0.15 * wave)
+
+
+def filter_path(path: str) -> str:
+    """Escape a file path for use as a filter option value"""
+    return Path(path).as_posix().replace(':', '\\:').replace("'", "\\'")
+
+
+# Whisper settings tuned for CPU-only CI runners
+WHISPER_OPTIONS = {
+    "language": "en",
+    "task": "transcribe",
+    "verbose": False,
+    "fp16": False,  # Disable FP16 for CPU (GitHub Actions)
+    "condition_on_previous_text": False,  # Faster processing
+    "compression_ratio_threshold": 2.4,
+    "logprob_threshold": -1.0,
+    "no_speech_threshold": 0.6,
+}
+WHISPER_SAMPLE_RATE = 16000
+# Shorter segments than this cost more in per-segment overhead than they save
+TRANSCRIBE_MIN_SEGMENT = 60.0
+# Target length of a parallel transcription segment: segments finish in order at a steady
+# pace, so the start of the transcript is ready long before the whole of it
+TRANSCRIBE_SEGMENT = 120.0
+# OpenRouter model for YouTube metadata; bump the prompt version whenever the prompt changes
+METADATA_MODEL = "deepseek/deepseek-chat"
+METADATA_PROMPT_VERSION = 1
+# Characters of the transcript the metadata prompt includes
+METADATA_TRANSCRIPT_CHARS = 2000
+# Metadata requests: attempts, backoff (seconds) and a hard limit on the whole exchange
+METADATA_MAX_ATTEMPTS = 5
+METADATA_BACKOFF_BASE = 1.0
+METADATA_BACKOFF_MAX = 30.0
+METADATA_CONNECT_TIMEOUT = 10.0
+METADATA_DEADLINE = 180.0
+# Seconds to wait for the whisper server health check before transcribing locally
+WHISPER_SERVER_PROBE_TIMEOUT = 0.5
+# Seconds to wait for a server transcription (at least; longer audio gets its own length)
+WHISPER_SERVER_TIMEOUT = 600.0
+# The whisper server is always local: never route it through an HTTP(S)_PROXY
+_local_opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+def silence_split_points(levels_db: List[float], window: float, duration: float,
+                         segments: int) -> List[float]:
+    """Times that cut audio into `segments` similar parts, each moved to the quietest nearby window"""
+    points = []
+    length = duration / segments
+    radius = max(1, int(length / 4 / window))
+    for k in range(1, segments):
+        center = int(k * length / window)
+        lo = max(center - radius, 0)
+        hi = min(center + radius + 1, len(levels_db))
+        if lo >= hi:
+            continue
+        quietest = min(range(lo, hi), key=lambda i: levels_db[i])
+        points.append((quietest + 0.5) * window)
+    return points
+
+
+def read_wav_segment(path: str, start: float, end: float):
+    """Samples of a 16-bit mono WAV between start and end, as float32 in [-1, 1]"""
+    import numpy as np
+    
+    with wave.open(path, 'rb') as wav:
+        rate = wav.getframerate()
+        wav.setpos(min(int(start * rate), wav.getnframes()))
+        frames = wav.readframes(max(0, int((end - start) * rate)))
+    return np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768.0
+
+
+# Whisper models loaded in this process, shared by every editor (batch mode edits many videos)
+_shared_whisper_models: Dict[str, Any] = {}
+_shared_whisper_lock = threading.Lock()
+
+
+def metadata_backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry `attempt + 1`: the server's Retry-After, else full-jitter exponential"""
+    if retry_after:
+        try:
+            return min(float(retry_after), METADATA_BACKOFF_MAX)
+        except ValueError:
+            pass  # HTTP-date form, fall back to our own backoff
+    return random.uniform(0, min(METADATA_BACKOFF_MAX, METADATA_BACKOFF_BASE * 2 ** attempt))
+
+
+def shared_whisper_model(model_name: str):
+    """Load a Whisper model once per process; hold _shared_whisper_lock while using it"""
+    import whisper
+    
+    if model_name not in _shared_whisper_models:
+        _shared_whisper_models[model_name] = whisper.load_model(model_name, device="cpu")
+    return _shared_whisper_models[model_name]
+
+
+# Whisper model of a transcription worker process, loaded once per process
+_whisper_model = None
+
+
+def _whisper_worker_init(model_name: str, threads: int):
+    """Process pool initializer: load the model once, split the cores between workers"""
+    global _whisper_model
+    import torch
+    import whisper
+    
+    torch.set_num_threads(threads)
+    _whisper_model = whisper.load_model(model_name, device="cpu")
+
+
+def whisper_pool(model_name: str, workers: int) -> ProcessPoolExecutor:
+    """Process pool of Whisper workers, each loading the model once and getting its share of the cores"""
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    # Spawn, not fork: this can run next to the chunk threads (and is the Windows default)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_whisper_worker_init,
+        initargs=(model_name, threads)
+    )
+
+
+def _transcribe_wav_segment(path: str, start: float, end: float) -> List[Dict[str, Any]]:
+    """Transcribe one slice of a WAV in a worker; timestamps come back on the full timeline"""
+    result = _whisper_model.transcribe(read_wav_segment(path, start, end), **WHISPER_OPTIONS)
+    return [
+        {
+            "start": start + seg["start"],
+            "end": min(start + seg["end"], end),
+            "text": seg["text"].strip()
+        }
+        for seg in result["segments"]
+    ]
+
+
+class TranscriptProgress:
+    """Text of a transcription as it grows, for threads that only need its beginning"""
+    
+    def __init__(self):
+        self.text = ""
+        self.complete = False
+        self._finished = False
+        self._changed = threading.Condition()
+    
+    def update(self, text: str):
+        """Publish the transcript so far (always a prefix of the final text)"""
+        with self._changed:
+            self.text = text
+            self._changed.notify_all()
+    
+    def finish(self, complete: bool):
+        """Mark the transcription as over; complete=False when it failed or was cancelled"""
+        with self._changed:
+            self.complete = complete
+            self._finished = True
+            self._changed.notify_all()
+    
+    def wait_for(self, chars: int) -> str:
+        """Block until `chars` characters exist or the transcription is over
+        
+        Returns "" when it ended early without producing that much text.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: len(self.text) >= chars or self._finished)
+            if len(self.text) >= chars or self.complete:
+                return self.text
+            return ""
+
+
+class FileLock:
+    """Exclusive advisory lock on a file, portable between POSIX and Windows
+    
+    The OS drops the lock when the holding process dies, so a crashed run
+    never leaves a stale lock behind.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+    
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock; with blocking=False, return False if another process holds it"""
+        self._file = open(self.path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            self._file.close()
+            self._file = None
+            return False
+        return True
+    
+    def release(self):
+        """Give the lock up (no-op if it isn't held)"""
+        if self._file is None:
+            return
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+# Temp space promised to chunks that are still rendering, by every editor in the process:
+# batch videos render side by side on the same disk, so they must see each other's needs
+_disk_reserved = 0
+_disk_lock = threading.Lock()
+# Seconds between free-space checks while only other editors' chunks hold the space
+DISK_WAIT_SECONDS = 5.0
+
+
+# Open metrics stages of the current thread, innermost last: [(RunMetrics, stage name), ...]
+_metrics_context = threading.local()
+
+
+class RunMetrics:
+    """Wall time, CPU, peak memory and I/O of each editor stage, for edit_state.json and run reports
+    
+    Stages may nest. Child processes count towards the innermost stage open on
+    the thread that waited for them (see wait_process).
+    """
+    
+    def __init__(self):
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def stage(self, name: str, media_seconds: Optional[float] = None):
+        """Measure the enclosed block as (one more call of) stage `name`"""
+        stack = getattr(_metrics_context, 'stack', None)
+        if stack is None:
+            stack = _metrics_context.stack = []
+        stack.append((self, name))
+        start = time.perf_counter()
+        thread_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self._add(name, calls=1, wall_seconds=time.perf_counter() - start,
+                      python_cpu_seconds=time.thread_time() - thread_cpu,
+                      media_seconds=media_seconds or 0.0)
+    
+    def _add(self, name: str, peak_rss_mb: float = 0.0, **totals: float):
+        with self._lock:
+            entry = self.stages.setdefault(name, {
+                "calls": 0, "wall_seconds": 0.0, "python_cpu_seconds": 0.0, "media_seconds": 0.0,
+                "processes": 0, "child_user_seconds": 0.0, "child_system_seconds": 0.0,
+                "peak_rss_mb": 0.0, "read_mb": 0.0, "write_mb": 0.0
+            })
+            for key, value in totals.items():
+                entry[key] += value
+            entry["peak_rss_mb"] = max(entry["peak_rss_mb"], peak_rss_mb)
+    
+    @staticmethod
+    def record_process(usage):
+        """Charge a finished child's rusage to the current thread's innermost stage"""
+        stack = getattr(_metrics_context, 'stack', None)
+        if not stack:
+            return
+        metrics, name = stack[-1]
+        # ru_maxrss is in KiB on Linux but bytes on macOS, and includes what the editor itself
+        # had resident when it forked, so it's an upper bound; block counts are 512-byte
+        # units and only cover real disk I/O (page cache hits aren't counted)
+        rss_unit = 1 if sys.platform == 'darwin' else 1024
+        metrics._add(
+            name,
+            processes=1,
+            child_user_seconds=usage.ru_utime,
+            child_system_seconds=usage.ru_stime,
+            peak_rss_mb=usage.ru_maxrss * rss_unit / (1024 * 1024),
+            read_mb=usage.ru_inblock * 512 / (1024 * 1024),
+            write_mb=usage.ru_oublock * 512 / (1024 * 1024)
+        )
+    
+    def report(self, media_seconds: float = 0.0) -> Dict[str, Any]:
+        """Totals plus per-stage figures, with realtime factors (media seconds per wall second)"""
+        wall = time.perf_counter() - self._start
+        with self._lock:
+            stages = {}
+            for name, entry in self.stages.items():
+                stage = {key: round(value, 3) for key, value in entry.items()}
+                stage["calls"] = int(entry["calls"])
+                stage["processes"] = int(entry["processes"])
+                if entry["media_seconds"] and entry["wall_seconds"]:
+                    stage["realtime"] = round(entry["media_seconds"] / entry["wall_seconds"], 3)
+                stages[name] = stage
+        
+        report = {
+            "started_at": self.started_at,
+            "wall_seconds": round(wall, 3),
+            "media_seconds": round(media_seconds, 3),
+            "realtime": round(media_seconds / wall, 3) if wall else 0.0,
+            "stages": stages
+        }
+        try:
+            import resource
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            rss_unit = 1 if sys.platform == 'darwin' else 1024
+            report["editor_peak_rss_mb"] = round(usage.ru_maxrss * rss_unit / (1024 * 1024), 1)
+        except ImportError:
+            pass
+        return report
+
+
+def wait_process(process: subprocess.Popen) -> int:
+    """Wait for a child process and record its resource usage in the current metrics stage"""
+    if not hasattr(os, 'wait4'):
+        # No per-child rusage on Windows
+        return process.wait()
+    try:
+        _, status, usage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        # Already reaped (e.g. by poll()), returncode is known
+        return process.wait()
+    process.returncode = os.waitstatus_to_exitcode(status)
+    RunMetrics.record_process(usage)
+    return process.returncode
+
+
+def run_process(cmd: List[str], text: bool = False) -> subprocess.CompletedProcess:
+    """Like subprocess.run(cmd, check=True, capture_output=True), with the child's usage recorded"""
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        # Read stderr on a thread so neither pipe can fill up and stall the child
+        stderr = []
+        reader = threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+        reader.start()
+        stdout = process.stdout.read()
+        reader.join()
+        returncode = wait_process(process)
+    
+    stderr = stderr[0] if stderr else b''
+    if text:
+        stdout = stdout.decode(errors='replace')
+        stderr = stderr.decode(errors='replace')
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+# Bump when a stage's ffmpeg arguments change in a way its cache params don't capture
+ARTIFACT_CACHE_VERSION = 2
+
+
+class ArtifactCache:
+    """Content-addressed store for intermediate edit artifacts with LRU eviction
+    
+    Keys hash (input key, stage name, stage params). A stage's key is the
+    input key of the next stage, so only the chunk input itself is hashed.
+    With a ttl (seconds), entries expire that long after they were stored and
+    reads no longer refresh them, so eviction becomes oldest-first.
+    
+    Several editors (processes or batch threads) may share a cache directory:
+    writers use unique temp files, eviction holds a lock file, and an entry
+    evicted under a reader counts as a miss.
+    """
+    
+    def __init__(self, cache_dir: Path, max_bytes: int, ttl: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+    
+    @staticmethod
+    def key(input_key: str, stage: str, params: Any) -> str:
+        """Cache key for running `stage` with `params` on the given input"""
+        payload = json.dumps({
+            "version": ARTIFACT_CACHE_VERSION,
+            "input": input_key,
+            "stage": stage,
+            "params": params
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str, suffix: str = ".mp4") -> Path:
+        return self.cache_dir / f"{key}{suffix}"
+    
+    def _expired(self, mtime: float) -> bool:
+        return self.ttl is not None and time.time() - mtime > self.ttl
+    
+    def _hit(self, entry: Path) -> bool:
+        """Whether entry is usable; marks it used, or drops it once expired (lock held)
+        
+        Raises FileNotFoundError if another editor evicts the entry meanwhile.
+        """
+        if not entry.exists():
+            return False
+        if self.ttl is None:
+            os.utime(entry)  # Mark as recently used
+            return True
+        if self._expired(entry.stat().st_mtime):
+            entry.unlink(missing_ok=True)
+            return False
+        return True
+    
+    def _temp_path(self) -> Path:
+        """Unique temp file in the cache dir, so concurrent writers of one key never collide"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        return Path(tmp_path)
+    
+    def fetch(self, key: str, dest: str) -> bool:
+        """Place a cached artifact at dest; False on a miss"""
+        if not self.enabled:
+            return False
+        
+        entry = self._entry_path(key)
+        with self._lock:
+            try:
+                if not self._hit(entry):
+                    return False
+                self._place(entry, Path(dest))
+            except FileNotFoundError:
+                return False
+        return True
+    
+    def store(self, key: str, src: str):
+        """Add a finished artifact to the cache"""
+        if not self.enabled or not Path(src).exists():
+            return
+        
+        entry = self._entry_path(key)
+        with self._lock:
+            tmp_entry = self._temp_path()
+            try:
+                self._place(Path(src), tmp_entry)
+                os.replace(tmp_entry, entry)
+            finally:
+                tmp_entry.unlink(missing_ok=True)
+            self._evict()
+    
+    def load_json(self, key: str) -> Optional[Any]:
+        """Cached analysis result (e.g. an edit decision list), or None"""
+        if not self.enabled:
+            return None
+        
+        entry = self._entry_path(key, ".json")
+        with self._lock:
+            try:
+                if not self._hit(entry):
+                    return None
+                with open(entry, 'r') as f:
+                    return json.load(f)
+            except FileNotFoundError:
+                return None
+    
+    def save_json(self, key: str, data: Any):
+        """Cache an analysis result"""
+        if not self.enabled:
+            return
+        
+        entry = self._entry_path(key, ".json")
+        with self._lock:
+            tmp_entry = self._temp_path()
+            try:
+                with open(tmp_entry, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_entry, entry)
+            finally:
+                tmp_entry.unlink(missing_ok=True)
+            self._evict()
+    
+    @staticmethod
+    def _place(src: Path, dest: Path):
+        """Hard-link src to dest, copying when linking isn't possible"""
+        if dest.exists():
+            dest.unlink()
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copy2(src, dest)
+    
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until the cache fits max_bytes"""
+        # Other editors sharing the directory evict too; one at a time
+        evict_lock = FileLock(self.cache_dir / ".lock")
+        evict_lock.acquire()
+        try:
+            self._evict_locked()
+        finally:
+            evict_lock.release()
+    
+    def _evict_locked(self):
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            if entry.suffix == '.tmp' or entry.name == '.lock':
+                continue
+            try:
+                stat = entry.stat()
+                if self._expired(stat.st_mtime):
+                    entry.unlink()
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+            except FileNotFoundError:
+                continue
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+                total -= size
+            except OSError as e:
+                logger.warning(f"Could not evict cache entry {entry.name}: {e}")
 
 
 class VideoEditor:
     """Main video editing orchestrator"""
     
-    def __init__(self, config: EditConfig, work_dir: Path):
+    def __init__(self, config: EditConfig, work_dir: Path, cache_dir: Optional[Path] = None,
+                 chunk_pool: Optional[ThreadPoolExecutor] = None,
+                 transcribe_pool: Optional[ProcessPoolExecutor] = None):
         self.config = config
         self.work_dir = work_dir
+        # Batch runs share one cache directory, one chunk worker pool and one
+        # Whisper process pool (see whisper_pool) between videos
+        self.cache_dir = cache_dir or work_dir / "cache"
+        self.chunk_pool = chunk_pool
+        self.transcribe_pool = transcribe_pool
         self.chunks_dir = work_dir / "chunks"
         self.temp_dir = work_dir / "temp"
         self.state_file = work_dir / "edit_state.json"
@@ -78,6 +1067,43 @@ class VideoEditor:
         self.chunks_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         
+        # Guards state updates coming from parallel chunk workers
+        self._state_lock = threading.RLock()
+        
+        # Intermediate artifacts survive state resets, so re-runs only redo changed stages
+        self.artifact_cache = ArtifactCache(
+            self.cache_dir / "artifacts",
+            self.config.artifact_cache_mb * 1024 * 1024
+        )
+        
+        # Transcripts and AI metadata: keyed by content, kept across runs until they expire
+        self.result_cache = ArtifactCache(
+            self.cache_dir / "results",
+            self.config.result_cache_mb * 1024 * 1024,
+            ttl=self.config.result_cache_ttl_days * 24 * 3600
+        )
+        
+        # Content keys of files whose content is known without hashing them (chunk inputs
+        # and stage outputs); fast fingerprints include mtime, so they can't key content caches
+        self._content_keys: Dict[str, str] = {}
+        
+        # Analysis results by cache key: each chunk's audio is decoded (and its scenes
+        # detected) once per editor, even with the artifact cache disabled
+        self._analysis_memo: Dict[str, Any] = {}
+        self._analysis_lock = threading.Lock()
+        
+        # Whether the whisper server answered its health check (probed on first use)
+        self._whisper_server_up: Optional[bool] = None
+        
+        # Set when the edit fails, so background transcription and metadata work stop early
+        self._cancelled = threading.Event()
+        
+        # Whole-program loudness measurement (set by run()); None means one-pass loudnorm
+        self.loudness: Optional[Dict[str, float]] = None
+        
+        # Per-stage timing, CPU, memory and I/O of this run (saved with the state and as a report)
+        self.metrics = RunMetrics()
+        
         # Load or initialize state
         self.state = self._load_state()
         
@@ -94,23 +1120,150 @@ class VideoEditor:
         }
     
     def _save_state(self):
-        """Save editing state"""
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        """Save editing state (atomic replace so a crash never leaves half a file)"""
+        with self._state_lock:
+            tmp_file = self.state_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_file, self.state_file)
     
-    def _get_video_duration(self, video_path: str) -> float:
-        """Get video duration using ffprobe"""
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            video_path
-        ]
+    def _update_chunk_state(self, chunk: ChunkInfo):
+        """Persist a finished chunk into its slot in the state file"""
+        with self._state_lock:
+            for i, state_chunk in enumerate(self.state["chunks"]):
+                if state_chunk["chunk_id"] == chunk.chunk_id:
+                    self.state["chunks"][i] = asdict(chunk)
+                    break
+            self._save_state()
+    
+    def _chunk_workers(self, pending: int) -> int:
+        """Number of chunks to process concurrently (max_workers capped by cores)"""
+        cpu_count = os.cpu_count() or 1
+        return max(1, min(self.config.max_workers, cpu_count, pending))
+    
+    def _process_chunks_parallel(self, chunks: List[ChunkInfo]) -> bool:
+        """Process independent chunks concurrently, saving state as each one finishes"""
+        pending = [c for c in chunks if not c.processed]
+        if not pending:
+            return True
+        
+        workers = self._chunk_workers(len(pending))
+        if self.chunk_pool is not None:
+            logger.info(f"Processing {len(pending)} chunks on the shared batch workers...")
+            pool = self.chunk_pool
+        else:
+            logger.info(f"Processing {len(pending)} chunks with {workers} worker(s)...")
+            # Chunks only touch their own files, and ffmpeg does the heavy lifting in
+            # child processes, so a thread pool is enough to keep all cores busy
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk")
+        
+        try:
+            # Chunks start one by one, each only if its temp files fit above the free-space floor
+            waiting = list(pending)
+            running = {}
+            while waiting or running:
+                while waiting and len(running) < workers:
+                    chunk = waiting[0]
+                    needed = self._chunk_disk_estimate(chunk)
+                    if not self._reserve_disk(needed):
+                        if not _disk_reserved:
+                            # Nothing else holds space that could be freed
+                            logger.error(
+                                f"Not enough free disk space for chunk {chunk.chunk_id} (needs ~{needed / (1024 * 1024):.0f} MB "
+                                f"and min_free_disk_mb={self.config.min_free_disk_mb} must stay free)"
+                            )
+                            return False
+                        logger.info(f"Waiting for disk space before starting chunk {chunk.chunk_id}...")
+                        break
+                    future = pool.submit(self._process_chunk, chunk)
+                    # Released when the chunk is over, however it ends (even after we stop waiting)
+                    future.add_done_callback(lambda _, needed=needed: self._release_disk(needed))
+                    running[future] = (chunk, needed)
+                    waiting.pop(0)
+                
+                if not running:
+                    # Other editors' chunks hold the space; check again once some may be done
+                    time.sleep(DISK_WAIT_SECONDS)
+                    continue
+                done, _ = wait(running, timeout=DISK_WAIT_SECONDS if waiting else None,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk, _ = running.pop(future)
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.error(f"Chunk {chunk.chunk_id} worker crashed: {e}")
+                        success = False
+                    
+                    if not success:
+                        logger.error(f"Failed to process chunk {chunk.chunk_id}")
+                        for other in running:
+                            other.cancel()
+                        return False
+                    
+                    self._update_chunk_state(chunk)
+                    # The split input is only read by its own chunk
+                    self._discard(chunk.input_path)
+        finally:
+            if pool is not self.chunk_pool:
+                pool.shutdown(wait=True)
+        
+        return True
+    
+    def _chunk_disk_estimate(self, chunk: ChunkInfo) -> int:
+        """Bytes of temp files a chunk may need at once while it renders"""
+        try:
+            source_size = Path(chunk.input_path).stat().st_size
+        except OSError:
+            return 0
+        return int(source_size * self._encoding_profile().disk_factor)
+    
+    def _reserve_disk(self, needed: int) -> bool:
+        """Reserve temp space for a chunk if it fits next to every chunk (of any editor) still rendering"""
+        global _disk_reserved
+        with _disk_lock:
+            if not self._disk_has_room(needed + _disk_reserved):
+                return False
+            _disk_reserved += needed
+            return True
+    
+    @staticmethod
+    def _release_disk(needed: int):
+        """Give back a chunk's reservation (see _reserve_disk)"""
+        global _disk_reserved
+        with _disk_lock:
+            _disk_reserved -= needed
+    
+    def _disk_has_room(self, needed: int) -> bool:
+        """True if writing `needed` more bytes still leaves min_free_disk_mb free in the work dir"""
+        if self.config.min_free_disk_mb <= 0:
+            return True
+        free = shutil.disk_usage(self.work_dir).free
+        return free - needed >= self.config.min_free_disk_mb * 1024 * 1024
+    
+    def _discard(self, path: Optional[str]):
+        """Delete a consumed intermediate (kept when cleanup_intermediates is off)"""
+        if not self.config.cleanup_intermediates or not path:
+            return
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return float(result.stdout.strip())
+            Path(path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not delete temp file {path}: {e}")
+    
+    def _consume(self, input_path: str, output_path: str):
+        """Move an intermediate to its final place (copy it when intermediates are kept)"""
+        if self.config.cleanup_intermediates:
+            shutil.move(input_path, output_path)
+        else:
+            shutil.copy2(input_path, output_path)
+    
+    def _probe(self, video_path: str, keyframes: bool = False) -> MediaInfo:
+        """Get (cached) media info for a file"""
+        try:
+            return probe_media(video_path, keyframes=keyframes)
         except FileNotFoundError:
+            if not Path(video_path).exists():
+                raise
             logger.error("=" * 60)
             logger.error("FFmpeg/ffprobe not found!")
             logger.error("=" * 60)
@@ -123,18 +1276,44 @@ class VideoEditor:
             logger.error("=" * 60)
             raise
     
+    def _get_video_duration(self, video_path: str) -> float:
+        """Get video duration using ffprobe"""
+        return self._probe(video_path).duration
+    
+    def _get_keyframe_times(self, video_path: str) -> List[float]:
+        """Get keyframe timestamps of the first video stream (packet scan, no decoding)"""
+        return self._probe(video_path, keyframes=True).keyframes or []
+    
+    def _snap_boundaries(self, duration: float, keyframes: List[float]) -> List[float]:
+        """Chunk boundaries every chunk_duration, moved onto the nearest keyframe"""
+        boundaries = [0.0]
+        target = float(self.config.chunk_duration)
+        
+        while target < duration:
+            boundary = target
+            if keyframes:
+                boundary = min(keyframes, key=lambda k: abs(k - target))
+            # Keep boundaries strictly increasing and inside the video
+            if boundaries[-1] < boundary < duration:
+                boundaries.append(boundary)
+            target += self.config.chunk_duration
+        
+        boundaries.append(duration)
+        return boundaries
+    
     def _calculate_chunks(self) -> List[ChunkInfo]:
-        """Calculate video chunks for processing"""
+        """Calculate video chunks for processing (boundaries snapped to keyframes)"""
         if self.state.get("chunks"):
             return [ChunkInfo(**c) for c in self.state["chunks"]]
         
+        keyframes = self._get_keyframe_times(self.config.input_video)
         duration = self._get_video_duration(self.config.input_video)
-        chunks = []
-        chunk_id = 0
+        if not keyframes:
+            logger.warning("Could not read keyframe index, chunk edges may not be exact")
+        boundaries = self._snap_boundaries(duration, keyframes)
         
-        start = 0
-        while start < duration:
-            end = min(start + self.config.chunk_duration, duration)
+        chunks = []
+        for chunk_id, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
             chunk = ChunkInfo(
                 chunk_id=chunk_id,
                 start_time=start,
@@ -144,8 +1323,6 @@ class VideoEditor:
                 output_path=str(self.chunks_dir / f"chunk_{chunk_id:03d}_output.mp4")
             )
             chunks.append(chunk)
-            chunk_id += 1
-            start = end
         
         # Save chunks to state
         self.state["chunks"] = [asdict(c) for c in chunks]
@@ -159,107 +1336,462 @@ class VideoEditor:
         """Split video into chunks"""
         logger.info(f"Splitting video into {len(chunks)} chunks...")
         
-        for chunk in chunks:
-            if Path(chunk.input_path).exists():
-                logger.info(f"Chunk {chunk.chunk_id} already exists, skipping split")
-                continue
+        # Processed chunks don't need their input any more (it's deleted once consumed)
+        missing = [c for c in chunks if not c.processed and not Path(c.input_path).exists()]
+        if not missing:
+            logger.info("All chunks already exist, skipping split")
+            return
+        
+        # Fresh split: emit every chunk from a single read of the input
+        if len(missing) == len(chunks) and len(chunks) > 1:
+            try:
+                self._split_segment_pass(chunks)
+                return
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"Single-pass split failed, extracting chunks one by one: {e}")
+        
+        for chunk in missing:
+            logger.info(f"Extracting chunk {chunk.chunk_id}: {chunk.start_time:.2f}s - {chunk.end_time:.2f}s")
+            
+            # -ss before -i seeks the input directly instead of decoding from zero
+            cmd = [
+                'ffmpeg',
+                '-ss', str(chunk.start_time),
+                '-i', self.config.input_video,
+                '-t', str(chunk.duration),
+                '-c', 'copy',
+                '-y',
+                chunk.input_path
+            ]
+            
+            run_process(cmd)
+            logger.info(f"Chunk {chunk.chunk_id} extracted successfully")
+    
+    def _split_segment_pass(self, chunks: List[ChunkInfo]):
+        """Write all chunks with one ffmpeg segment muxer pass"""
+        # Boundaries sit on keyframes; back off 1ms so rounding in the probed
+        # timestamps can't push a cut onto the following keyframe
+        segment_times = ','.join(f"{max(c.start_time - 0.001, 0.0):.3f}" for c in chunks[1:])
+        pattern = str(self.chunks_dir / "chunk_%03d_input.mp4")
+        
+        logger.info(f"Splitting {len(chunks)} chunks in a single pass...")
+        cmd = [
+            'ffmpeg',
+            '-i', self.config.input_video,
+            '-map', '0:v:0',
+            '-map', '0:a:0?',
+            '-c', 'copy',
+            '-f', 'segment',
+            '-segment_times', segment_times,
+            '-segment_format', 'mp4',
+            '-reset_timestamps', '1',
+            '-y',
+            pattern
+        ]
+        run_process(cmd)
+        
+        missing = [c.chunk_id for c in chunks if not Path(c.input_path).exists()]
+        if missing:
+            raise subprocess.CalledProcessError(1, cmd, stderr=f"segments missing for chunks {missing}")
+        logger.info("All chunks extracted successfully")
+    
+    def _process_chunk(self, chunk: ChunkInfo) -> bool:
+        """Process a single chunk with all editing effects"""
+        logger.info(f"Processing chunk {chunk.chunk_id}...")
+        
+        # Check if already processed
+        if chunk.processed and Path(chunk.output_path).exists():
+            logger.info(f"Chunk {chunk.chunk_id} already processed, skipping")
+            return True
+        
+        # Children outside the render stages (analysis, concat re-encode, probes) count here
+        with self.metrics.stage("chunk", chunk.duration):
+            try:
+                # A leftover output may be stale (or hard-linked into the cache), never write through it
+                if Path(chunk.output_path).exists():
+                    Path(chunk.output_path).unlink()
+            
+                self._content_keys[chunk.input_path] = self._chunk_input_key(chunk)
+            
+                rendered = False
+                if self.config.fuse_chunk_filters:
+                    with self.metrics.stage("chunk_fused", chunk.duration):
+                        rendered = self._process_chunk_fused(chunk)
+            
+                if not rendered and self.config.pipe_stages:
+                    with self.metrics.stage("chunk_piped", chunk.duration):
+                        rendered = self._process_chunk_piped(chunk)
+            
+                if not rendered:
+                    self._process_chunk_steps(chunk)
+            
+                # Calculate checksum
+                chunk.checksum = self._calculate_checksum(chunk.output_path)
+                # Only the fused and piped renders cut exactly the source intervals computed
+                # up front; the step path detects its cuts on intermediates (or may fall back
+                # to not cutting), so its time map is unknown and subtitles come from the output
+                chunk.keep = self._chunk_source_keep(chunk.input_path) if rendered else None
+                chunk.output_duration = self._get_video_duration(chunk.output_path)
+                chunk.processed = True
+            
+                logger.info(f"Chunk {chunk.chunk_id} processed successfully")
+                return True
+            
+            except Exception as e:
+                logger.error(f"Error processing chunk {chunk.chunk_id}: {e}")
+                return False
+    
+    def _chunk_cut_keep(self, input_path: str) -> Optional[List[Tuple[float, float]]]:
+        """Keep intervals of silence removal and jump cuts combined, or None when nothing is cut
+        
+        Never empty: a chunk that would be cut entirely keeps its first SILENT_CHUNK_KEEP seconds.
+        """
+        # Steps 1 and 3: silence removal and jump cuts both come down to keep
+        # intervals on the source timeline, applied to video and audio together
+        keep = None
+        silence_edl = None
+        if self.config.remove_silence:
+            silence_edl = self._silence_edl(input_path)
+            if silence_edl and silence_edl["removed"]:
+                keep = silence_edl["keep"]
+        
+        if self.config.jump_cut_threshold > 0:
+            # Pauses measured before the speed-up are `speed` times longer
+            jump_keep = self._jump_cut_keep(
+                input_path, self.config.jump_cut_threshold * self.config.speed_multiplier
+            )
+            if jump_keep is not None:
+                keep = intersect_intervals(keep, jump_keep) if keep is not None else jump_keep
+        
+        if keep is not None and not keep:
+            keep = [(0.0, min(SILENT_CHUNK_KEEP, self._get_video_duration(input_path)))]
+        return keep
+    
+    def _chunk_source_keep(self, input_path: str) -> List[List[float]]:
+        """Intervals of a chunk input that survive the fused/piped edit"""
+        keep = self._chunk_cut_keep(input_path)
+        if keep is None:
+            return [[0.0, self._get_video_duration(input_path)]]
+        return [[start, end] for start, end in keep]
+    
+    def _chunk_filter_stages(self, input_path: str) -> List[Tuple[str, List[str], List[str]]]:
+        """(stage, video filters, audio filters) for every enabled per-chunk effect, in order"""
+        stages = []
+        keep = self._chunk_cut_keep(input_path)
+        
+        # Without an EDL (NumPy missing, audio undecodable) silence can't be cut from
+        # video and audio together; shortening only the audio would desync them
+        if self.config.remove_silence and self._silence_edl(input_path) is None:
+            logger.warning("  No silence edit decision list, skipping silence removal")
+        
+        if keep:
+            video_filter, audio_filter = self._select_filters(keep)
+            stages.append(("cuts", [video_filter], [audio_filter]))
+        
+        # Step 2: Speed
+        if self.config.speed_multiplier != 1.0:
+            video_filter, audio_filter = self._speed_filters(self.config.speed_multiplier)
+            stages.append(("speed", [video_filter], [audio_filter]))
+        
+        # Step 4: Zoom
+        if self.config.apply_zoom_effects:
+            width, height = self._get_video_dimensions(input_path)
+            # Upper bound on the stream length at this point (cuts only shorten it)
+            max_duration = self._get_video_duration(input_path) / min(self.config.speed_multiplier, 1.0)
+            stages.append(("zoom", [self._zoom_filter(width, height, input_path, max_duration)], []))
+        
+        # Step 5: Color grading
+        if self.config.apply_transitions:
+            stages.append(("trans", [self._color_grade_filter()], []))
+        
+        # Step 6: Audio enhancement
+        if self.config.add_sound_effects:
+            stages.append(("sfx", [], [self._audio_enhance_filter()]))
+        
+        # Final: normalize for the concat demuxer (matches _reencode_for_concat)
+        stages.append((
+            "concat",
+            [f"fps={CONCAT_FPS},format={CONCAT_PIX_FMT}"],
+            [f"aresample={CONCAT_SAMPLE_RATE}"]
+        ))
+        
+        return stages
+    
+    def _build_chunk_filtergraph(self, input_path: str) -> str:
+        """Compose every enabled per-chunk effect into one filter_complex graph"""
+        stages = self._chunk_filter_stages(input_path)
+        video_filters = [f for _, stage_video, _ in stages for f in stage_video]
+        audio_filters = [f for _, _, stage_audio in stages for f in stage_audio]
+        
+        return (
+            f"[0:v]{','.join(video_filters)}[v];"
+            f"[0:a]{','.join(audio_filters)}[a]"
+        )
+    
+    def _process_chunk_fused(self, chunk: ChunkInfo) -> bool:
+        """Render a chunk with one decode and one encode; False means use the step path"""
+        fused_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_fused.mp4")
+        
+        try:
+            filter_complex = self._build_chunk_filtergraph(chunk.input_path)
+            encode_args = self._video_encode_args() + self._audio_encode_args()
+            
+            cache_key = self.artifact_cache.key(
+                self._chunk_input_key(chunk), "fused", [filter_complex] + encode_args
+            )
+            if self.artifact_cache.fetch(cache_key, chunk.output_path):
+                logger.info(f"  Reusing cached render for chunk {chunk.chunk_id}")
+                return True
+            
+            logger.info(f"  Rendering chunk {chunk.chunk_id} in a single fused pass...")
+            
+            cmd = [
+                'ffmpeg',
+                '-i', chunk.input_path,
+                '-filter_complex', filter_complex,
+                '-map', '[v]',
+                '-map', '[a]',
+            ] + encode_args + [
+                '-y',
+                fused_output
+            ]
+            run_process(cmd)
+            
+            # Only publish a complete file, so a crash never looks like a finished chunk
+            os.replace(fused_output, chunk.output_path)
+            self.artifact_cache.store(cache_key, chunk.output_path)
+            return True
+            
+        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
+            logger.warning(f"  Fused pass failed for chunk {chunk.chunk_id}, falling back to step-by-step: {e}")
+            try:
+                if Path(fused_output).exists():
+                    Path(fused_output).unlink()
+            except Exception:
+                pass
+            return False
+    
+    def _piped_stage_commands(self, input_path: str, output_path: str,
+                              stages: List[Tuple[str, List[str], List[str]]]) -> List[List[str]]:
+        """One ffmpeg command per stage; all but the last stream raw frames as NUT to stdout"""
+        commands = []
+        for index, (stage, video_filters, audio_filters) in enumerate(stages):
+            last = index == len(stages) - 1
+            
+            if index == 0:
+                cmd = ['ffmpeg', '-nostdin', '-v', 'error', '-i', input_path, '-map', '0:v:0', '-map', '0:a:0']
+            else:
+                cmd = ['ffmpeg', '-v', 'error', '-f', 'nut', '-i', 'pipe:0']
+            if video_filters:
+                cmd += ['-vf', ','.join(video_filters)]
+            if audio_filters:
+                cmd += ['-af', ','.join(audio_filters)]
+            
+            if last:
+                cmd += self._video_encode_args() + self._audio_encode_args() + ['-y', output_path]
+            else:
+                # Uncompressed between stages: nothing is encoded until the last process
+                cmd += ['-c:v', 'rawvideo', '-c:a', 'pcm_s16le', '-f', 'nut', 'pipe:1']
+            commands.append(cmd)
+        
+        return commands
+    
+    def _process_chunk_piped(self, chunk: ChunkInfo) -> bool:
+        """Run each stage as its own ffmpeg, chained over pipes; False means use the step path"""
+        piped_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_piped.mp4")
+        processes = []
+        
+        try:
+            stages = self._chunk_filter_stages(chunk.input_path)
+            commands = self._piped_stage_commands(chunk.input_path, piped_output, stages)
+            
+            cache_key = self.artifact_cache.key(
+                self._chunk_input_key(chunk), "piped",
+                [stages, self._video_encode_args() + self._audio_encode_args()]
+            )
+            if self.artifact_cache.fetch(cache_key, chunk.output_path):
+                logger.info(f"  Reusing cached piped render for chunk {chunk.chunk_id}")
+                return True
+            
+            logger.info(
+                f"  Rendering chunk {chunk.chunk_id} through {len(commands)} piped stages "
+                f"({', '.join(stage for stage, _, _ in stages)})..."
+            )
+            
+            # Every stage runs at once: stage N+1 decodes while stage N is still filtering
+            upstream = None
+            for cmd in commands:
+                stderr = tempfile.TemporaryFile()
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=upstream if upstream is not None else subprocess.DEVNULL,
+                    stdout=subprocess.PIPE if cmd[-1] == 'pipe:1' else subprocess.DEVNULL,
+                    stderr=stderr
+                )
+                # The child holds its own copy; closing ours lets EOF/SIGPIPE propagate
+                if upstream is not None:
+                    upstream.close()
+                upstream = process.stdout
+                processes.append((process, stderr))
             
-            logger.info(f"Extracting chunk {chunk.chunk_id}: {chunk.start_time:.2f}s - {chunk.end_time:.2f}s")
+            failed = []
+            for (process, stderr), (stage, _, _) in zip(processes, stages):
+                if wait_process(process) != 0:
+                    stderr.seek(0)
+                    failed.append(f"{stage}: {stderr.read().decode(errors='replace').strip()}")
+            if failed:
+                raise subprocess.CalledProcessError(1, commands[-1], stderr='; '.join(failed))
             
-            cmd = [
-                'ffmpeg',
-                '-i', self.config.input_video,
-                '-ss', str(chunk.start_time),
-                '-t', str(chunk.duration),
-                '-c', 'copy',
-                '-y',
-                chunk.input_path
-            ]
+            os.replace(piped_output, chunk.output_path)
+            self.artifact_cache.store(cache_key, chunk.output_path)
+            return True
             
-            subprocess.run(cmd, check=True, capture_output=True)
-            logger.info(f"Chunk {chunk.chunk_id} extracted successfully")
+        except (subprocess.CalledProcessError, ValueError, IndexError, OSError) as e:
+            detail = getattr(e, 'stderr', None) or e
+            logger.warning(f"  Piped stages failed for chunk {chunk.chunk_id}, falling back to step-by-step: {detail}")
+            for process, _ in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+            try:
+                if Path(piped_output).exists():
+                    Path(piped_output).unlink()
+            except Exception:
+                pass
+            return False
+        
+        finally:
+            for _, stderr in processes:
+                stderr.close()
     
-    def _process_chunk(self, chunk: ChunkInfo) -> bool:
-        """Process a single chunk with all editing effects"""
-        logger.info(f"Processing chunk {chunk.chunk_id}...")
+    def _chunk_input_key(self, chunk: ChunkInfo) -> str:
+        """Content key of a chunk's source file, the root of its stage cache keys
         
-        # Check if already processed
-        if Path(chunk.output_path).exists():
-            logger.info(f"Chunk {chunk.chunk_id} already processed, skipping")
-            return True
+        Derived from the input video and the chunk's span rather than the split
+        file, which is rewritten (with a new mtime) on every fresh run.
+        """
+        return self.artifact_cache.key(
+            self._content_key(self.config.input_video), "chunk",
+            {"start": chunk.start_time, "end": chunk.end_time}
+        )
+    
+    def _content_key(self, path: str) -> str:
+        """Key for caching results computed from a file's content (never mtime based)"""
+        return self._content_keys.get(path) or sha256_file(path)
+    
+    def _run_cached_stage(self, chunk: ChunkInfo, stage: str, input_path: str, input_key: str,
+                          params: Any, func, temp_files: List[str]) -> Tuple[str, str]:
+        """Run one step-path stage unless the cache already holds its output
+        
+        func(input_path, output_path) returns False when the effect failed and it
+        wrote a fallback instead; that output is never cached as the stage's result.
+        """
+        output_path = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_{stage}.mp4")
+        temp_files.append(output_path)
+        
+        # Same stage on the same input, but encoded differently, is a different artifact
+        encoding = self._video_encode_args() + self._audio_encode_args()
+        cache_key = self.artifact_cache.key(input_key, stage, [params, encoding])
+        if self.artifact_cache.fetch(cache_key, output_path):
+            logger.info(f"  Reusing cached {stage} output for chunk {chunk.chunk_id}")
+        else:
+            if Path(output_path).exists():
+                Path(output_path).unlink()
+            with self.metrics.stage(f"chunk_{stage}", chunk.duration):
+                applied = func(input_path, output_path)
+            if applied:
+                self.artifact_cache.store(cache_key, output_path)
+            else:
+                # Later stages still work from a key that names what this file holds
+                cache_key = self.artifact_cache.key(input_key, f"{stage}_fallback", [params, encoding])
+        self._content_keys[output_path] = cache_key
+        
+        # The previous stage's output has been consumed, don't hold it until the chunk is done
+        if input_path in temp_files:
+            self._discard(input_path)
         
+        return output_path, cache_key
+    
+    def _process_chunk_steps(self, chunk: ChunkInfo):
+        """Apply each effect as its own ffmpeg pass (fallback path)"""
         temp_files = []
         current_input = chunk.input_path
+        current_key = self._chunk_input_key(chunk)
         
         try:
             # Step 1: Remove silence using auto-editor
             if self.config.remove_silence:
-                silence_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_nosilence.mp4")
-                temp_files.append(silence_output)
-                
                 logger.info(f"  Removing silence from chunk {chunk.chunk_id}...")
-                self._remove_silence(current_input, silence_output)
-                current_input = silence_output
+                current_input, current_key = self._run_cached_stage(
+                    chunk, "nosilence", current_input, current_key,
+                    {
+                        "silence_threshold": self.config.silence_threshold,
+                        "silence_duration": self.config.silence_duration,
+                        "window": AUDIO_ANALYSIS_WINDOW,
+                    },
+                    self._remove_silence, temp_files
+                )
             
             # Step 2: Apply speed adjustment
             if self.config.speed_multiplier != 1.0:
-                speed_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_speed.mp4")
-                temp_files.append(speed_output)
-                
-                logger.info(f"  Applying {self.config.speed_multiplier}x speed to chunk {chunk.chunk_id}...")
-                self._apply_speed(current_input, speed_output, self.config.speed_multiplier)
-                current_input = speed_output
+                speed = self.config.speed_multiplier
+                logger.info(f"  Applying {speed}x speed to chunk {chunk.chunk_id}...")
+                current_input, current_key = self._run_cached_stage(
+                    chunk, "speed", current_input, current_key,
+                    self._speed_filters(speed),
+                    lambda src, dst: self._apply_speed(src, dst, speed), temp_files
+                )
             
             # Step 3: Apply jump cuts
-            jump_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_jumpcuts.mp4")
-            temp_files.append(jump_output)
-            
-            logger.info(f"  Applying jump cuts to chunk {chunk.chunk_id}...")
-            self._apply_jump_cuts(current_input, jump_output)
-            current_input = jump_output
+            if self.config.jump_cut_threshold > 0:
+                logger.info(f"  Applying jump cuts to chunk {chunk.chunk_id}...")
+                current_input, current_key = self._run_cached_stage(
+                    chunk, "jumpcuts", current_input, current_key,
+                    {
+                        "jump_cut_threshold": self.config.jump_cut_threshold,
+                        "silence_threshold": self.config.silence_threshold,
+                        "window": AUDIO_ANALYSIS_WINDOW,
+                        "padding": JUMP_CUT_PADDING,
+                    },
+                    self._apply_jump_cuts, temp_files
+                )
             
             # Step 4: Apply zoom and Ken Burns effects
             if self.config.apply_zoom_effects:
-                zoom_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_zoom.mp4")
-                temp_files.append(zoom_output)
-                
                 logger.info(f"  Applying zoom effects to chunk {chunk.chunk_id}...")
-                self._apply_zoom_effects(current_input, zoom_output)
-                current_input = zoom_output
+                current_input, current_key = self._run_cached_stage(
+                    chunk, "zoom", current_input, current_key,
+                    {"zoom_mode": self.config.zoom_mode, "fps": ZOOM_FPS},
+                    self._apply_zoom_effects, temp_files
+                )
             
             # Step 5: Add transitions
             if self.config.apply_transitions:
-                trans_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_trans.mp4")
-                temp_files.append(trans_output)
-                
                 logger.info(f"  Adding transitions to chunk {chunk.chunk_id}...")
-                self._add_transitions(current_input, trans_output)
-                current_input = trans_output
+                current_input, current_key = self._run_cached_stage(
+                    chunk, "trans", current_input, current_key,
+                    self._color_grade_filter(), self._add_transitions, temp_files
+                )
             
             # Step 6: Add sound effects
             if self.config.add_sound_effects:
-                sfx_output = str(self.temp_dir / f"chunk_{chunk.chunk_id:03d}_sfx.mp4")
-                temp_files.append(sfx_output)
-                
                 logger.info(f"  Adding sound effects to chunk {chunk.chunk_id}...")
-                self._add_sound_effects(current_input, sfx_output)
-                current_input = sfx_output
+                current_input, current_key = self._run_cached_stage(
+                    chunk, "sfx", current_input, current_key,
+                    self._audio_enhance_filter(), self._add_sound_effects, temp_files
+                )
             
             # Final: Copy to output with consistent encoding
-            logger.info(f"  Re-encoding chunk {chunk.chunk_id} for concatenation...")
-            self._reencode_for_concat(current_input, chunk.output_path)
-            
-            # Calculate checksum
-            chunk.checksum = self._calculate_checksum(chunk.output_path)
-            chunk.processed = True
-            
-            logger.info(f"Chunk {chunk.chunk_id} processed successfully")
-            return True
+            cache_key = self.artifact_cache.key(
+                current_key, "concat", self._video_encode_args() + self._audio_encode_args()
+            )
+            if self.artifact_cache.fetch(cache_key, chunk.output_path):
+                logger.info(f"  Reusing cached concat encode for chunk {chunk.chunk_id}")
+            else:
+                logger.info(f"  Normalizing chunk {chunk.chunk_id} for concatenation...")
+                self._reencode_for_concat(current_input, chunk.output_path)
+                self.artifact_cache.store(cache_key, chunk.output_path)
             
-        except Exception as e:
-            logger.error(f"Error processing chunk {chunk.chunk_id}: {e}")
-            return False
-        
         finally:
             # Cleanup temp files (ignore errors if files are locked)
             for temp_file in temp_files:
@@ -269,145 +1801,382 @@ class VideoEditor:
                 except Exception as e:
                     logger.warning(f"Could not delete temp file {temp_file}: {e}")
     
-    def _remove_silence(self, input_path: str, output_path: str):
-        """Remove silence using ffmpeg silencedetect and silenceremove"""
-        logger.info("Detecting and removing silence...")
+    def _speed_filters(self, speed: float) -> Tuple[str, str]:
+        """(video, audio) filters for a speed change"""
+        video_speed = 1.0 / speed
+        audio_speed = speed
+        return f'setpts={video_speed}*PTS', f'atempo={audio_speed}'
+    
+    def _zoom_filter(self, width: int, height: int, input_path: Optional[str] = None,
+                     duration: float = 0.0) -> str:
+        """Dynamic "breathing" zoom filter chain for the configured zoom_mode"""
+        mode = self.config.zoom_mode
+        if mode not in ZOOM_MODES:
+            raise ValueError(f"Unknown zoom_mode '{mode}', expected one of {list(ZOOM_MODES)}")
+        
+        if mode == "curve":
+            curve_file = self._write_zoom_curve(input_path, width, height, duration)
+            return (
+                f"fps={ZOOM_FPS},"
+                f"sendcmd=f='{filter_path(curve_file)}',"
+                f"crop=w={width}:h={height},"
+                f"scale={width}:{height},"
+                f"setsar=1"
+            )
+        
+        # zoompan emits one frame per input frame at its own rate, so pin both
+        # sides to 30fps or the video drifts away from the audio
+        zoom_filter = (
+            f"fps={ZOOM_FPS},"
+            f"zoompan="
+            f"z='if(lte(mod(time,8),4),min(1.15,1+0.15*sin(time*PI/4)),max(1,1.15-0.15*sin(time*PI/4)))':"
+            f"d=1:"
+            f"x='iw/2-(iw/zoom/2)':"
+            f"y='ih/2-(ih/zoom/2)':"
+            f"s={width}x{height}:"
+            f"fps={ZOOM_FPS}"
+        )
+        if mode == "quality":
+            zoom_filter += f",minterpolate=fps={ZOOM_FPS}:mi_mode=mci"  # Smooth motion interpolation
+        return zoom_filter
+    
+    def _write_zoom_curve(self, input_path: Optional[str], width: int, height: int,
+                          duration: float) -> str:
+        """Write per-frame crop sizes for the zoom curve as a sendcmd script"""
+        stem = Path(input_path).stem if input_path else "zoom"
+        curve_file = self.temp_dir / f"{stem}_zoom_curve.cmd"
         
-        # Use ffmpeg's silenceremove filter
-        # This removes silence at the beginning, middle, and end
-        # Parameters:
-        # - stop_periods=-1: remove all silence segments
-        # - stop_duration: minimum silence duration to remove (in seconds)
-        # - stop_threshold: silence threshold in dB
+        lines = []
+        for frame in range(int(math.ceil(duration * ZOOM_FPS)) + 1):
+            t = frame / ZOOM_FPS
+            zoom = breathing_zoom(t)
+            # Even sizes keep yuv420p chroma aligned; crop stays centered by default
+            crop_w = max(2, int(width / zoom) // 2 * 2)
+            crop_h = max(2, int(height / zoom) // 2 * 2)
+            lines.append(f"{t:.4f} crop w {crop_w}, crop h {crop_h};")
         
-        silence_threshold_db = self.config.silence_threshold  # e.g., -40dB
-        silence_duration = self.config.silence_duration  # e.g., 0.5 seconds
+        with open(curve_file, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return str(curve_file)
+    
+    def _color_grade_filter(self) -> str:
+        """Color grading chain used by the transitions step"""
+        return (
+            "eq=saturation=1.2:contrast=1.1:brightness=0.02,"  # Color enhancement
+            "unsharp=5:5:1.0:5:5:0.0,"  # Slight sharpening
+            "vignette=PI/4"  # Subtle vignette for focus
+        )
+    
+    def _audio_enhance_filter(self) -> str:
+        """Audio enhancement chain: normalize, compress, and add presence"""
+        return (
+            f"{self._loudnorm_filter()},"  # Loudness normalization
+            "acompressor=threshold=-20dB:ratio=4:attack=5:release=50,"  # Compression
+            "equalizer=f=3000:width_type=h:width=200:g=2"  # Presence boost
+        )
+    
+    def _loudnorm_filter(self) -> str:
+        """Linear (second pass) loudnorm from the program measurement, else one-pass dynamic"""
+        target = ':'.join(f"{name}={value:g}" for name, value in LOUDNORM_TARGET.items())
+        measured = self.loudness
+        if not measured:
+            return f"loudnorm={target}"
+        return (
+            f"loudnorm={target}:"
+            f"measured_I={measured['input_i']}:"
+            f"measured_TP={measured['input_tp']}:"
+            f"measured_LRA={measured['input_lra']}:"
+            f"measured_thresh={measured['input_thresh']}:"
+            f"offset={measured['target_offset']}:"
+            f"linear=true"
+        )
+    
+    def _measure_loudness(self, input_path: str) -> Optional[Dict[str, float]]:
+        """Loudnorm first pass over the whole program, reused from the artifact cache"""
+        cache_key = self.artifact_cache.key(
+            self._content_key(input_path), "loudness", LOUDNORM_TARGET
+        )
+        measured = self.artifact_cache.load_json(cache_key)
+        if measured is not None:
+            return measured
         
-        # Build ffmpeg command with silenceremove filter
+        logger.info("Measuring program loudness...")
+        target = ':'.join(f"{name}={value:g}" for name, value in LOUDNORM_TARGET.items())
         cmd = [
             'ffmpeg',
+            '-hide_banner',
+            '-nostats',
             '-i', input_path,
-            '-af', (
-                f'silenceremove='
-                f'start_periods=1:'  # Remove silence at start
-                f'start_duration={silence_duration}:'
-                f'start_threshold={silence_threshold_db}dB:'
-                f'stop_periods=-1:'  # Remove all silence segments
-                f'stop_duration={silence_duration}:'
-                f'stop_threshold={silence_threshold_db}dB:'
-                f'detection=peak'  # Use peak detection
-            ),
-            '-c:v', 'copy',  # Copy video without re-encoding
+            '-vn',
+            '-af', f'loudnorm={target}:print_format=json',
+            '-f', 'null',
+            '-'
+        ]
+        
+        try:
+            result = run_process(cmd, text=True)
+            # The measurement is the last JSON object loudnorm prints to stderr
+            report = result.stderr[result.stderr.rindex('{'):result.stderr.rindex('}') + 1]
+            data = json.loads(report)
+            measured = {
+                name: float(data[name])
+                for name in ('input_i', 'input_tp', 'input_lra', 'input_thresh', 'target_offset')
+            }
+        except (subprocess.CalledProcessError, ValueError, KeyError) as e:
+            logger.warning(f"Loudness measurement failed, normalizing each chunk on its own: {e}")
+            return None
+        
+        if not all(math.isfinite(value) for value in measured.values()):
+            # Silent program: nothing to measure against
+            return None
+        
+        logger.info(f"Program loudness: {measured['input_i']:.1f} LUFS, peak {measured['input_tp']:.1f} dBTP")
+        self.artifact_cache.save_json(cache_key, measured)
+        return measured
+    
+    def _get_video_dimensions(self, video_path: str) -> Tuple[int, int]:
+        """Get (width, height) of the first video stream"""
+        info = self._probe(video_path)
+        if not info.has_video:
+            raise ValueError(f"No video stream in {video_path}")
+        return info.width, info.height
+    
+    def _cached_analysis(self, cache_key: str, compute) -> Optional[Any]:
+        """Result of an analysis from memory, the artifact cache or compute() (None is never kept)"""
+        with self._analysis_lock:
+            if cache_key in self._analysis_memo:
+                return self._analysis_memo[cache_key]
+        
+        result = self.artifact_cache.load_json(cache_key)
+        if result is None:
+            result = compute()
+            if result is None:
+                return None
+            self.artifact_cache.save_json(cache_key, result)
+        
+        with self._analysis_lock:
+            self._analysis_memo[cache_key] = result
+        return result
+    
+    def _audio_analysis(self, input_path: str) -> Optional[Dict[str, Any]]:
+        """Windowed audio levels for a file, decoded once and reused"""
+        def analyze():
+            try:
+                return analyze_audio_levels(input_path)
+            except ImportError:
+                logger.warning("NumPy not installed, audio analysis unavailable")
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"Could not decode audio for analysis: {e}")
+            return None
+        
+        cache_key = self.artifact_cache.key(
+            self._content_key(input_path), "audio_levels", {"window": AUDIO_ANALYSIS_WINDOW}
+        )
+        return self._cached_analysis(cache_key, analyze)
+    
+    def _silence_edl(self, input_path: str) -> Optional[Dict[str, Any]]:
+        """Edit decision list for silence removal: {"keep": [...], "removed": [...]}
+        
+        Silent windows are those whose peak stays under silence_threshold for at
+        least silence_duration. None when the audio can't be analyzed.
+        """
+        def build_edl():
+            analysis = self._audio_analysis(input_path)
+            if analysis is None:
+                return None
+            
+            duration = self._get_video_duration(input_path)
+            removed = quiet_spans(
+                analysis["peak_db"], analysis["window"],
+                self.config.silence_threshold, self.config.silence_duration
+            )
+            return {
+                "duration": duration,
+                "keep": keep_intervals(removed, duration),
+                "removed": removed
+            }
+        
+        cache_key = self.artifact_cache.key(
+            self._content_key(input_path), "silence_edl", {
+                "silence_threshold": self.config.silence_threshold,
+                "silence_duration": self.config.silence_duration,
+                "window": AUDIO_ANALYSIS_WINDOW,
+            }
+        )
+        return self._cached_analysis(cache_key, build_edl)
+    
+    def _select_filters(self, keep: List[Tuple[float, float]]) -> Tuple[str, str]:
+        """(video, audio) filters that keep only the given intervals, in sync"""
+        expression = '+'.join(f"between(t,{start:.3f},{end:.3f})" for start, end in keep)
+        # setpts=N/FRAME_RATE/TB restamps frames evenly, which only matches the audio
+        # on constant frame rate video: normalize variable frame rate sources first
+        return (
+            f"fps={CONCAT_FPS},select='{expression}',setpts=N/FRAME_RATE/TB",
+            f"aselect='{expression}',asetpts=N/SR/TB"
+        )
+    
+    def _apply_keep_intervals(self, input_path: str, output_path: str,
+                              keep: List[Tuple[float, float]], label: str) -> bool:
+        """Render only the keep intervals of input_path in one select/aselect pass (False: copied instead)"""
+        if not keep:
+            # Everything is cut: keep a short slice, like the fused path (see _chunk_cut_keep)
+            keep = [(0.0, SILENT_CHUNK_KEEP)]
+        video_filter, audio_filter = self._select_filters(keep)
+        cmd = [
+            'ffmpeg',
+            '-i', input_path,
+            '-filter_complex', f'[0:v]{video_filter}[v];[0:a]{audio_filter}[a]',
+            '-map', '[v]',
+            '-map', '[a]',
+            *self._video_encode_args(),
+            *CONCAT_VIDEO_ARGS,
+            *self._audio_encode_args(),
+            *CONCAT_AUDIO_ARGS,
             '-y',
             output_path
         ]
         
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.info("Silence removed successfully")
+            run_process(cmd)
+            return True
         except subprocess.CalledProcessError as e:
-            logger.warning(f"Silence removal failed: {e.stderr}")
-            logger.info("Copying original file without silence removal...")
+            logger.warning(f"{label} failed, copying original: {e}")
             shutil.copy2(input_path, output_path)
+            return False
+    
+    def _remove_silence(self, input_path: str, output_path: str) -> bool:
+        """Remove silence from video and audio together using the silence EDL (False: copied instead)"""
+        logger.info("Detecting and removing silence...")
+        
+        edl = self._silence_edl(input_path)
+        if edl is not None:
+            if not edl["removed"]:
+                logger.info("No silence found")
+                shutil.copy2(input_path, output_path)
+                return True
+            removed = sum(end - start for start, end in edl["removed"])
+            logger.info(f"Removing {len(edl['removed'])} silent spans ({removed:.1f}s)")
+            return self._apply_keep_intervals(input_path, output_path, edl["keep"], "Silence removal")
+        
+        # No EDL (NumPy missing, audio undecodable): cutting the audio alone would desync it
+        logger.warning("No silence edit decision list, skipping silence removal")
+        shutil.copy2(input_path, output_path)
+        return False
     
-    def _apply_speed(self, input_path: str, output_path: str, speed: float):
+    def _apply_speed(self, input_path: str, output_path: str, speed: float) -> bool:
         """Apply speed adjustment using ffmpeg"""
         # Calculate audio and video filters
-        video_speed = 1.0 / speed
-        audio_speed = speed
+        video_filter, audio_filter = self._speed_filters(speed)
         
         cmd = [
             'ffmpeg',
             '-i', input_path,
             '-filter_complex',
-            f'[0:v]setpts={video_speed}*PTS[v];[0:a]atempo={audio_speed}[a]',
+            f'[0:v]{video_filter}[v];[0:a]{audio_filter}[a]',
             '-map', '[v]',
             '-map', '[a]',
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
-            '-c:a', 'aac',
-            '-b:a', '128k',
+            *self._video_encode_args(),
+            *CONCAT_VIDEO_ARGS,
+            *self._audio_encode_args(),
+            *CONCAT_AUDIO_ARGS,
             '-y',
             output_path
         ]
-        subprocess.run(cmd, check=True, capture_output=True)
-    
-    def _apply_jump_cuts(self, input_path: str, output_path: str):
-        """Apply jump cuts using PySceneDetect and ffmpeg"""
-        # Try to detect scenes
-        import sys
-        scenes_file = str(self.temp_dir / "scenes.csv")
-        
-        # Try different ways to call scenedetect
-        commands = [
-            [sys.executable, '-m', 'scenedetect', '-i', input_path, 'detect-content'],
-            ['scenedetect', '-i', input_path, 'detect-content'],
-            ['py', '-m', 'scenedetect', '-i', input_path, 'detect-content'],
-        ]
+        run_process(cmd)
+        return True
+    
+    def _detect_scene_changes(self, input_path: str) -> List[float]:
+        """Scene change timestamps from PySceneDetect (library API, no subprocess)"""
+        try:
+            from scenedetect import detect, ContentDetector
+        except ImportError:
+            logger.info("PySceneDetect not installed, cutting on audio pauses only")
+            return []
         
-        scene_detected = False
-        for cmd in commands:
+        def detect_scenes():
             try:
-                cmd.extend([
-                    '--threshold', '27',
-                    'list-scenes',
-                    '-o', str(self.temp_dir),
-                    '-f', scenes_file
-                ])
-                subprocess.run(cmd, check=True, capture_output=True)
-                scene_detected = True
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
+                scenes = detect(input_path, ContentDetector(threshold=27.0), show_progress=False)
+            except Exception as e:
+                logger.warning(f"Scene detection failed, cutting on audio pauses only: {e}")
+                return None
+            # Every scene after the first starts on a cut
+            return [start.get_seconds() for start, _ in scenes[1:]]
+        
+        cache_key = self.artifact_cache.key(
+            self._content_key(input_path), "scene_changes", {"threshold": 27.0}
+        )
+        return self._cached_analysis(cache_key, detect_scenes) or []
+    
+    def _find_jump_cuts(self, input_path: str, min_pause: float) -> List[Tuple[float, float]]:
+        """Spans (start, end) of pauses to cut, from audio energy and scene changes"""
+        analysis = self._audio_analysis(input_path)
+        if analysis is None:
+            logger.warning("Skipping jump cuts")
+            return []
+        
+        scene_changes = self._detect_scene_changes(input_path)
+        pauses = quiet_spans(analysis["rms_db"], analysis["window"], self.config.silence_threshold)
+        
+        cuts = []
+        for start, end in pauses:
+            # A scene change already hides the jump, so shorter pauses are worth cutting there
+            at_scene_change = any(start <= t <= end for t in scene_changes)
+            threshold = min_pause / 2 if at_scene_change else min_pause
+            if end - start < threshold:
                 continue
+            
+            # Keep a little breathing room either side of the cut
+            cut_start = start + JUMP_CUT_PADDING
+            cut_end = end - JUMP_CUT_PADDING
+            if cut_end > cut_start:
+                cuts.append((cut_start, cut_end))
         
-        # For now, just copy (full scene-based editing would be complex)
-        # In production, you'd parse scenes and apply cuts
-        shutil.copy2(input_path, output_path)
+        return cuts
+    
+    def _jump_cut_keep(self, input_path: str, min_pause: float) -> Optional[List[Tuple[float, float]]]:
+        """Keep intervals that drop every detected pause, or None when nothing is cut"""
+        cuts = self._find_jump_cuts(input_path, min_pause)
+        if not cuts:
+            return None
+        
+        removed = sum(end - start for start, end in cuts)
+        logger.info(f"  Jump cuts: removing {len(cuts)} pauses ({removed:.1f}s)")
+        return keep_intervals(cuts, self._get_video_duration(input_path))
+    
+    def _apply_jump_cuts(self, input_path: str, output_path: str) -> bool:
+        """Cut pauses longer than jump_cut_threshold in a single select/aselect pass (False: copied instead)"""
+        keep = self._jump_cut_keep(input_path, self.config.jump_cut_threshold)
+        if keep is None:
+            shutil.copy2(input_path, output_path)
+            return True
+        
+        return self._apply_keep_intervals(input_path, output_path, keep, "Jump cuts")
     
-    def _apply_zoom_effects(self, input_path: str, output_path: str):
-        """Apply dynamic zoom and Ken Burns effects using ffmpeg"""
+    def _apply_zoom_effects(self, input_path: str, output_path: str) -> bool:
+        """Apply dynamic zoom and Ken Burns effects using ffmpeg (False: fell back to a simple zoom)"""
         # Get video dimensions and duration
-        probe_cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height,r_frame_rate',
-            '-of', 'csv=p=0',
-            input_path
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        parts = result.stdout.strip().split(',')
-        width, height = int(parts[0]), int(parts[1])
+        width, height = self._get_video_dimensions(input_path)
         
         duration = self._get_video_duration(input_path)
         
         # Create dynamic zoom: zoom in and out in waves for engagement
         # This creates a "breathing" effect that keeps viewers engaged
-        zoom_filter = (
-            f"zoompan="
-            f"z='if(lte(mod(time,8),4),min(1.15,1+0.15*sin(time*PI/4)),max(1,1.15-0.15*sin(time*PI/4)))':"
-            f"d=1:"
-            f"x='iw/2-(iw/zoom/2)':"
-            f"y='ih/2-(ih/zoom/2)':"
-            f"s={width}x{height},"
-            f"minterpolate=fps=30:mi_mode=mci"  # Smooth motion interpolation
-        )
+        zoom_filter = self._zoom_filter(width, height, input_path, duration)
         
         cmd = [
             'ffmpeg',
             '-i', input_path,
             '-vf', zoom_filter,
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
+            *self._video_encode_args(),
+            *CONCAT_VIDEO_ARGS,
             '-c:a', 'copy',
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
+            return True
         except subprocess.CalledProcessError as e:
             logger.warning(f"Dynamic zoom failed, trying simple zoom: {e}")
             # Fallback to simple zoom
@@ -416,27 +2185,21 @@ class VideoEditor:
                 'ffmpeg',
                 '-i', input_path,
                 '-vf', simple_zoom,
-                '-c:v', 'libx264',
-                '-preset', 'medium',
-                '-crf', '23',
+                *self._video_encode_args(),
+                *CONCAT_VIDEO_ARGS,
                 '-c:a', 'copy',
                 '-y',
                 output_path
             ]
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
+            return False
     
-    def _add_transitions(self, input_path: str, output_path: str):
-        """Add smooth transitions and color grading for engagement"""
+    def _add_transitions(self, input_path: str, output_path: str) -> bool:
+        """Add smooth transitions and color grading for engagement (False: copied instead)"""
         # Apply color grading and smooth motion for more engaging look
         # Increase saturation, contrast, and add slight vignette
         
-        filter_complex = (
-            "[0:v]"
-            "eq=saturation=1.2:contrast=1.1:brightness=0.02,"  # Color enhancement
-            "unsharp=5:5:1.0:5:5:0.0,"  # Slight sharpening
-            "vignette=PI/4"  # Subtle vignette for focus
-            "[v]"
-        )
+        filter_complex = f"[0:v]{self._color_grade_filter()}[v]"
         
         cmd = [
             'ffmpeg',
@@ -444,102 +2207,344 @@ class VideoEditor:
             '-filter_complex', filter_complex,
             '-map', '[v]',
             '-map', '0:a',
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
+            *self._video_encode_args(),
+            *CONCAT_VIDEO_ARGS,
             '-c:a', 'copy',
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
+            return True
         except subprocess.CalledProcessError as e:
             logger.warning(f"Color grading failed, copying original: {e}")
             shutil.copy2(input_path, output_path)
+            return False
     
-    def _add_sound_effects(self, input_path: str, output_path: str):
-        """Enhance audio for better engagement"""
+    def _add_sound_effects(self, input_path: str, output_path: str) -> bool:
+        """Enhance audio for better engagement (False: copied instead)"""
         # Apply audio enhancement: normalize, compress, and add presence
         
-        audio_filter = (
-            "loudnorm=I=-16:TP=-1.5:LRA=11,"  # Loudness normalization
-            "acompressor=threshold=-20dB:ratio=4:attack=5:release=50,"  # Compression
-            "equalizer=f=3000:width_type=h:width=200:g=2"  # Presence boost
-        )
+        audio_filter = self._audio_enhance_filter()
         
         cmd = [
             'ffmpeg',
             '-i', input_path,
             '-af', audio_filter,
             '-c:v', 'copy',
-            '-c:a', 'aac',
-            '-b:a', '192k',
+            *self._audio_encode_args(),
+            *CONCAT_AUDIO_ARGS,
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
+            return True
         except subprocess.CalledProcessError as e:
             logger.warning(f"Audio enhancement failed, copying original: {e}")
             shutil.copy2(input_path, output_path)
+            return False
+    
+    def _encoding_profile(self) -> EncodingProfile:
+        """The configured encoding profile (see ENCODING_PROFILES)"""
+        name = self.config.encoding_profile
+        if name not in ENCODING_PROFILES:
+            raise ValueError(f"Unknown encoding_profile '{name}', expected one of {list(ENCODING_PROFILES)}")
+        return ENCODING_PROFILES[name]
+    
+    def _video_encode_args(self, delivery: bool = False) -> List[str]:
+        """Video encoder options for temp files, or for the final output with delivery=True"""
+        profile = self._encoding_profile()
+        return list(profile.delivery_video if delivery else profile.intermediate_video)
+    
+    def _audio_encode_args(self, delivery: bool = False) -> List[str]:
+        """Audio encoder options for temp files, or for the final output with delivery=True"""
+        profile = self._encoding_profile()
+        return list(profile.delivery_audio if delivery else profile.intermediate_audio)
     
     def _reencode_for_concat(self, input_path: str, output_path: str):
-        """Re-encode with consistent settings for concatenation"""
+        """Bring a chunk to the concat target, re-encoding only the streams that differ"""
+        video_ok, audio_ok = concat_compatibility(self._probe(input_path))
+        
+        if video_ok and audio_ok:
+            logger.info("  Chunk already matches the concat target, remuxing")
+        elif video_ok or audio_ok:
+            logger.info(f"  Re-encoding {'audio' if video_ok else 'video'} only for concatenation")
+        
+        if video_ok:
+            video_args = ['-c:v', 'copy']
+        else:
+            video_args = self._video_encode_args() + CONCAT_VIDEO_ARGS
+        
+        if audio_ok:
+            audio_args = ['-c:a', 'copy']
+        else:
+            audio_args = self._audio_encode_args() + CONCAT_AUDIO_ARGS
+        
         cmd = [
             'ffmpeg',
             '-i', input_path,
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
-            '-pix_fmt', 'yuv420p',
-            '-r', '30',
-            '-c:a', 'aac',
-            '-b:a', '128k',
-            '-ar', '44100',
+        ] + video_args + audio_args + [
             '-y',
             output_path
         ]
-        subprocess.run(cmd, check=True, capture_output=True)
+        run_process(cmd)
     
-    def _calculate_checksum(self, file_path: str) -> str:
-        """Calculate file checksum for verification"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+    def _calculate_checksum(self, file_path: str, mode: Optional[str] = None) -> str:
+        """Calculate file checksum for verification (config.checksum_mode by default)"""
+        return file_checksum(file_path, mode or self.config.checksum_mode)
+    
+    def _concatenate_chunks(self, chunks: List[ChunkInfo], output_path: str):
+        """Concatenate all processed chunks"""
+        logger.info("Concatenating all chunks...")
+        
+        # Special case: if only 1 chunk, just copy it
+        if len(chunks) == 1:
+            logger.info("Only 1 chunk, using it directly...")
+            self._consume(chunks[0].output_path, output_path)
+            return
+        
+        # Create concat file for multiple chunks
+        concat_file = self.temp_dir / "concat_list.txt"
+        with open(concat_file, 'w') as f:
+            for chunk in chunks:
+                f.write(f"file '{Path(chunk.output_path).absolute()}'\n")
+        
+        # Stream copy needs identical codec headers in every chunk; a stream-copied
+        # source chunk next to an encoded one can differ, so re-encode in that case
+        signatures = {
+            (info.width, info.height, info.video_extradata, info.audio_codec,
+             info.sample_rate, info.channels) + concat_compatibility(info)
+            for info in (self._probe(chunk.output_path) for chunk in chunks)
+        }
+        if len(signatures) == 1 and all(next(iter(signatures))[-2:]):
+            codec_args = ['-c', 'copy']
+        else:
+            logger.warning("Chunk streams differ, re-encoding while concatenating")
+            codec_args = (self._video_encode_args() + CONCAT_VIDEO_ARGS
+                          + self._audio_encode_args() + CONCAT_AUDIO_ARGS)
+        
+        cmd = [
+            'ffmpeg',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(concat_file),
+        ] + codec_args + [
+            '-y',
+            output_path
+        ]
+        
+        run_process(cmd)
+        logger.info("Chunks concatenated successfully")
+    
+    def _subtitle_filter(self, subtitle_file: Path) -> str:
+        """Burn-in filter for styled subtitles"""
+        subtitle_style = (
+            "FontName=Arial Bold,"
+            "FontSize=24,"
+            "PrimaryColour=&H00FFFFFF,"
+            "OutlineColour=&H00000000,"
+            "BackColour=&H80000000,"
+            "Bold=1,"
+            "Outline=2,"
+            "Shadow=1,"
+            "Alignment=2"
+        )
+        return f"subtitles={subtitle_file}:force_style='{subtitle_style}'"
+    
+    def _subscribe_overlay_filter(self, duration: float) -> str:
+        """Overlay filter showing the subscribe image at 30% and 70% of the video"""
+        popup_times = [duration * 0.3, duration * 0.7]
+        enable = '+'.join(f"between(t,{time},{time+3})" for time in popup_times)
+        return f"overlay=W-w-10:H-h-10:enable='{enable}'"
+    
+    def _subscribe_popup_graph(self, video_label: str, image_label: str, output_label: str,
+                               duration: float) -> str:
+        """Filtergraph overlaying the subscribe image on a video stream, sized for popup_reference_height"""
+        overlay = self._subscribe_overlay_filter(duration)
+        reference = self.config.popup_reference_height
+        if not reference:
+            return f"[{video_label}][{image_label}]{overlay}[{output_label}]"
+        
+        # Scale the image with the video (e.g. a preview proxy of a larger source) so the
+        # popup covers the same share of the frame as in the full resolution render
+        return (
+            f"[{image_label}][{video_label}]"
+            f"scale2ref=w='iw*main_h/{reference}':h='ih*main_h/{reference}'[popup][popup_base];"
+            f"[popup_base][popup]{overlay}[{output_label}]"
+        )
+    
+    def _music_filter(self, duration: float) -> str:
+        """Processing chain for the background music track"""
+        fade_duration = 3.0  # 3 seconds for smoother fade
+        
+        # Advanced audio processing chain:
+        # 1. EQ: Reduce high frequencies (reduce harshness), boost low frequencies (warmth)
+        # 2. Compression: Smooth out volume peaks
+        # 3. Volume adjustment
+        # 4. Smooth fade in/out with exponential curve
+        return (
+            # High-pass filter to reduce bass rumble
+            f'highpass=f=80,'
+            # Low-pass filter to reduce harsh highs
+            f'lowpass=f=10000,'
+            # EQ adjustments for smooth blend
+            f'equalizer=f=8000:width_type=o:width=2:g=-4,'  # Reduce highs
+            f'equalizer=f=250:width_type=o:width=2:g=2,'    # Boost low-mids (warmth)
+            f'equalizer=f=4000:width_type=o:width=2:g=-2,'  # Reduce mid-highs
+            # Compress to smooth out volume
+            f'acompressor=threshold=-18dB:ratio=3:attack=50:release=300,'
+            # Set volume
+            f'volume={self.config.background_music_volume},'
+            # Smooth exponential fade in/out
+            f'afade=t=in:st=0:d={fade_duration}:curve=esin,'
+            f'afade=t=out:st={duration-fade_duration}:d={fade_duration}:curve=esin'
+        )
+    
+    def _finish_video(self, input_path: str, output_path: str):
+        """Apply the whole-video finishing effects and write the final output"""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        subtitle_file = Path(self.config.input_video).with_suffix('.srt')
+        subscribe_image = Path("assets/subscribe.png")
+        music_file = self.config.background_music
+        
+        use_subtitles = self.config.add_subtitles and subtitle_file.exists()
+        use_popup = self.config.add_subscribe_popup and subscribe_image.exists()
+        use_music = bool(music_file) and Path(music_file).exists()
+        
+        if not (use_subtitles or use_popup or use_music):
+            if self.config.add_subtitles or self.config.add_subscribe_popup or music_file:
+                logger.warning("Finishing assets not found, skipping finishing effects")
+            self._deliver(input_path, output_path)
+            return
+        
+        if self.config.fuse_finishing:
+            if self._finish_video_fused(input_path, output_path, use_subtitles, use_popup, use_music):
+                return
+        
+        self._finish_video_steps(input_path, output_path)
+    
+    def _deliver(self, input_path: str, output_path: str):
+        """Write the final output, with the delivery encode if intermediates aren't final quality"""
+        if self._encoding_profile().delivers_intermediate:
+            logger.info("Creating final output...")
+            self._consume(input_path, output_path)
+            return
+        
+        logger.info(f"Encoding final output ({self.config.encoding_profile} profile)...")
+        partial_output = str(Path(output_path).with_suffix('.partial.mp4'))
+        cmd = [
+            'ffmpeg',
+            '-i', input_path,
+            *self._video_encode_args(delivery=True),
+            *self._audio_encode_args(delivery=True),
+            '-y',
+            partial_output
+        ]
+        run_process(cmd)
+        os.replace(partial_output, output_path)
+    
+    def _finish_video_fused(self, input_path: str, output_path: str,
+                            use_subtitles: bool, use_popup: bool, use_music: bool) -> bool:
+        """Render every finishing effect with a single encode straight to the output"""
+        logger.info("Applying finishing effects in a single pass...")
+        
+        # Write next to the output, then rename: the final file is never half-written
+        partial_output = str(Path(output_path).with_suffix('.partial.mp4'))
+        
+        try:
+            duration = self._get_video_duration(input_path)
+            inputs = ['-i', input_path]
+            filter_parts = []
+            video_label = '0:v'
+            
+            if use_subtitles:
+                subtitle_file = Path(self.config.input_video).with_suffix('.srt')
+                filter_parts.append(f"[0:v]{self._subtitle_filter(subtitle_file)}[vsub]")
+                video_label = 'vsub'
+            
+            if use_popup:
+                image_index = len(inputs) // 2
+                inputs += ['-i', "assets/subscribe.png"]
+                filter_parts.append(
+                    self._subscribe_popup_graph(video_label, f"{image_index}:v", "vpop", duration)
+                )
+                video_label = 'vpop'
+            
+            # Streams left untouched are copied only if intermediates are delivery quality
+            reencode = not self._encoding_profile().delivers_intermediate
+            
+            audio_args = ['-map', '0:a', '-c:a', 'copy']
+            if reencode:
+                audio_args = ['-map', '0:a'] + self._audio_encode_args(delivery=True)
+            if use_music:
+                music_index = len(inputs) // 2
+                inputs += ['-stream_loop', '-1', '-i', self.config.background_music]
+                filter_parts.append(f"[{music_index}:a]{self._music_filter(duration)}[music]")
+                filter_parts.append("[0:a][music]amix=inputs=2:duration=first:dropout_transition=2[a]")
+                audio_args = ['-map', '[a]'] + self._audio_encode_args(delivery=True) + ['-shortest']
+            
+            if video_label != '0:v':
+                video_args = ['-map', f'[{video_label}]'] + self._video_encode_args(delivery=True)
+            elif reencode:
+                video_args = ['-map', '0:v'] + self._video_encode_args(delivery=True)
+            else:
+                # Audio-only finishing: leave the video stream untouched
+                video_args = ['-map', '0:v', '-c:v', 'copy']
+            
+            cmd = ['ffmpeg'] + inputs + [
+                '-filter_complex', ';'.join(filter_parts)
+            ] + video_args + audio_args + ['-y', partial_output]
+            
+            run_process(cmd)
+            os.replace(partial_output, output_path)
+            logger.info("Finishing effects applied successfully")
+            return True
+            
+        except (subprocess.CalledProcessError, ValueError) as e:
+            logger.warning(f"Fused finishing pass failed, falling back to separate passes: {e}")
+            try:
+                if Path(partial_output).exists():
+                    Path(partial_output).unlink()
+            except Exception:
+                pass
+            return False
     
-    def _concatenate_chunks(self, chunks: List[ChunkInfo], output_path: str):
-        """Concatenate all processed chunks"""
-        logger.info("Concatenating all chunks...")
+    def _finish_video_steps(self, input_path: str, output_path: str):
+        """Apply finishing effects one pass at a time (fallback path)"""
+        current_output = input_path
         
-        # Special case: if only 1 chunk, just copy it
-        if len(chunks) == 1:
-            logger.info("Only 1 chunk, copying directly...")
-            shutil.copy2(chunks[0].output_path, output_path)
-            logger.info("Chunk copied successfully")
-            return
+        # Each pass deletes the previous pass's output once it has read it (but not the
+        # concatenated input, which run() keeps until finishing is recorded)
+        def advance(next_output: str):
+            nonlocal current_output
+            if current_output != input_path:
+                self._discard(current_output)
+            current_output = next_output
         
-        # Create concat file for multiple chunks
-        concat_file = self.temp_dir / "concat_list.txt"
-        with open(concat_file, 'w') as f:
-            for chunk in chunks:
-                f.write(f"file '{Path(chunk.output_path).absolute()}'\n")
+        # Add subtitles
+        if self.config.add_subtitles:
+            subtitle_output = str(self.temp_dir / "with_subtitles.mp4")
+            self._add_subtitles(current_output, subtitle_output)
+            advance(subtitle_output)
         
-        cmd = [
-            'ffmpeg',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', str(concat_file),
-            '-c', 'copy',
-            '-y',
-            output_path
-        ]
+        # Add subscribe popup
+        if self.config.add_subscribe_popup:
+            subscribe_output = str(self.temp_dir / "with_subscribe.mp4")
+            self._add_subscribe_popup(current_output, subscribe_output)
+            advance(subscribe_output)
         
-        subprocess.run(cmd, check=True, capture_output=True)
-        logger.info("Chunks concatenated successfully")
+        # Add background music
+        if self.config.background_music:
+            music_output = str(self.temp_dir / "with_music.mp4")
+            self._add_background_music(current_output, music_output)
+            advance(music_output)
+        
+        self._deliver(current_output, output_path)
+        advance(output_path)
     
     def _add_subtitles(self, input_path: str, output_path: str):
         """Add animated styled subtitles"""
@@ -555,32 +2560,18 @@ class VideoEditor:
             return
         
         # Apply styled subtitles with ffmpeg
-        subtitle_style = (
-            "FontName=Arial Bold,"
-            "FontSize=24,"
-            "PrimaryColour=&H00FFFFFF,"
-            "OutlineColour=&H00000000,"
-            "BackColour=&H80000000,"
-            "Bold=1,"
-            "Outline=2,"
-            "Shadow=1,"
-            "Alignment=2"
-        )
-        
         cmd = [
             'ffmpeg',
             '-i', input_path,
-            '-vf', f"subtitles={subtitle_file}:force_style='{subtitle_style}'",
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
+            '-vf', self._subtitle_filter(subtitle_file),
+            *self._video_encode_args(),
             '-c:a', 'copy',
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
         except subprocess.CalledProcessError:
             logger.warning("Subtitle addition failed, copying original")
             shutil.copy2(input_path, output_path)
@@ -600,30 +2591,22 @@ class VideoEditor:
         
         # Add popup at 30% and 70% of video duration
         duration = self._get_video_duration(input_path)
-        popup_times = [duration * 0.3, duration * 0.7]
-        
-        # Create overlay filter
-        overlay_filter = ""
-        for i, time in enumerate(popup_times):
-            overlay_filter += f"[0:v]overlay=W-w-10:H-h-10:enable='between(t,{time},{time+3})'[v{i}];"
         
         cmd = [
             'ffmpeg',
             '-i', input_path,
             '-i', str(subscribe_image),
-            '-filter_complex', overlay_filter[:-1],  # Remove last semicolon
-            '-map', '[v1]' if len(popup_times) > 1 else '[v0]',
+            '-filter_complex', self._subscribe_popup_graph("0:v", "1:v", "v", duration),
+            '-map', '[v]',
             '-map', '0:a',
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
+            *self._video_encode_args(),
             '-c:a', 'copy',
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
         except subprocess.CalledProcessError:
             logger.warning("Subscribe popup failed, copying original")
             shutil.copy2(input_path, output_path)
@@ -639,14 +2622,7 @@ class VideoEditor:
         
         # Get video duration for fade timing
         duration = self._get_video_duration(input_path)
-        fade_duration = 3.0  # 3 seconds for smoother fade
         
-        # Advanced audio processing chain:
-        # 1. EQ: Reduce high frequencies (reduce harshness), boost low frequencies (warmth)
-        # 2. Compression: Smooth out volume peaks
-        # 3. Volume adjustment
-        # 4. Smooth fade in/out with exponential curve
-        # 5. Sidechain ducking - lower music when voice is present
         cmd = [
             'ffmpeg',
             '-i', input_path,
@@ -655,23 +2631,7 @@ class VideoEditor:
             '-filter_complex',
             (
                 # Process background music with EQ and compression
-                f'[1:a]'
-                # High-pass filter to reduce bass rumble
-                f'highpass=f=80,'
-                # Low-pass filter to reduce harsh highs
-                f'lowpass=f=10000,'
-                # EQ adjustments for smooth blend
-                f'equalizer=f=8000:width_type=o:width=2:g=-4,'  # Reduce highs
-                f'equalizer=f=250:width_type=o:width=2:g=2,'    # Boost low-mids (warmth)
-                f'equalizer=f=4000:width_type=o:width=2:g=-2,'  # Reduce mid-highs
-                # Compress to smooth out volume
-                f'acompressor=threshold=-18dB:ratio=3:attack=50:release=300,'
-                # Set volume
-                f'volume={self.config.background_music_volume},'
-                # Smooth exponential fade in/out
-                f'afade=t=in:st=0:d={fade_duration}:curve=esin,'
-                f'afade=t=out:st={duration-fade_duration}:d={fade_duration}:curve=esin'
-                f'[music];'
+                f'[1:a]{self._music_filter(duration)}[music];'
                 # Simple mix without aggressive ducking (better for continuous speech)
                 # Music stays present but subtle throughout
                 f'[0:a][music]amix=inputs=2:duration=first:dropout_transition=2[a]'
@@ -679,15 +2639,14 @@ class VideoEditor:
             '-map', '0:v',
             '-map', '[a]',
             '-c:v', 'copy',
-            '-c:a', 'aac',
-            '-b:a', '192k',
+            *self._audio_encode_args(),
             '-shortest',
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
             logger.info("Background music blended smoothly with advanced EQ and ducking")
         except subprocess.CalledProcessError as e:
             logger.warning(f"Advanced music processing failed, trying simple mix: {e}")
@@ -714,15 +2673,14 @@ class VideoEditor:
             '-map', '0:v',
             '-map', '[a]',
             '-c:v', 'copy',
-            '-c:a', 'aac',
-            '-b:a', '192k',
+            *self._audio_encode_args(),
             '-shortest',
             '-y',
             output_path
         ]
         
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_process(cmd)
             logger.info("Background music added with simple mixing")
         except subprocess.CalledProcessError as e:
             logger.warning(f"Failed to add background music: {e}")
@@ -732,12 +2690,9 @@ class VideoEditor:
         """Extract subtitles using Whisper AI (optimized for GitHub Actions)"""
         logger.info("Extracting subtitles with Whisper AI...")
         
-        try:
-            import whisper
-            import torch
-        except ImportError:
+        if not self._whisper_available():
             logger.warning("Whisper not installed. Skipping subtitle extraction.")
-            logger.info("Install with: pip install openai-whisper")
+            logger.info("Install with: pip install openai-whisper (or run whisper_server.py)")
             return None
         
         try:
@@ -747,46 +2702,13 @@ class VideoEditor:
                 'ffmpeg',
                 '-i', video_path,
                 '-vn', '-acodec', 'pcm_s16le',
-                '-ar', '16000', '-ac', '1',
+                '-ar', str(WHISPER_SAMPLE_RATE), '-ac', '1',
                 '-y', audio_path
             ]
-            subprocess.run(cmd, check=True, capture_output=True)
-            
-            # Load Whisper model (with caching for GitHub Actions)
-            # Use 'base' model - good balance of speed/accuracy
-            # Model will be cached in ~/.cache/whisper/ for future runs
-            logger.info("Loading Whisper model (will cache for future runs)...")
-            
-            # Force CPU mode for GitHub Actions (no GPU available)
-            device = "cpu"
-            model = whisper.load_model("base", device=device)
+            run_process(cmd)
             
-            # Transcribe with optimized settings for CI/CD
-            logger.info("Transcribing audio...")
-            result = model.transcribe(
-                audio_path,
-                language="en",
-                task="transcribe",
-                verbose=False,
-                fp16=False,  # Disable FP16 for CPU (GitHub Actions)
-                condition_on_previous_text=False,  # Faster processing
-                compression_ratio_threshold=2.4,
-                logprob_threshold=-1.0,
-                no_speech_threshold=0.6
-            )
-            
-            # Save as SRT
-            with open(output_srt, 'w', encoding='utf-8') as f:
-                for i, segment in enumerate(result['segments'], start=1):
-                    start = self._format_srt_timestamp(segment['start'])
-                    end = self._format_srt_timestamp(segment['end'])
-                    text = segment['text'].strip()
-                    f.write(f"{i}\n{start} --> {end}\n{text}\n\n")
-            
-            # Also save full transcript as .txt for AI metadata
-            txt_path = Path(output_srt).with_suffix('.txt')
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(result['text'].strip())
+            segments, text = self._transcribe_audio(audio_path)
+            txt_path = self._write_transcript(segments, text, output_srt)
             
             # Cleanup audio
             try:
@@ -796,7 +2718,7 @@ class VideoEditor:
             
             logger.info(f"Subtitles saved: {output_srt}")
             logger.info(f"Transcript saved: {txt_path}")
-            return result['text'].strip()
+            return text
             
         except Exception as e:
             logger.warning(f"Subtitle extraction failed: {e}")
@@ -804,29 +2726,276 @@ class VideoEditor:
             traceback.print_exc()
             return None
     
-    def _format_srt_timestamp(self, seconds: float) -> str:
-        """Convert seconds to SRT timestamp (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    def _start_source_transcription(self, progress: TranscriptProgress):
+        """Transcribe the source audio in the background while the chunks are edited
+        
+        The text is published to `progress` as segments finish.
+        """
+        def transcribe_source():
+            audio_path = str(self.temp_dir / "source_audio.wav")
+            cmd = [
+                'ffmpeg',
+                '-i', self.config.input_video,
+                '-vn', '-acodec', 'pcm_s16le',
+                '-ar', str(WHISPER_SAMPLE_RATE), '-ac', '1',
+                '-y', audio_path
+            ]
+            complete = False
+            try:
+                with self.metrics.stage("source_transcription", self._get_video_duration(self.config.input_video)):
+                    run_process(cmd)
+                    try:
+                        self._check_cancelled()
+                        result = self._transcribe_audio(audio_path, progress)
+                    finally:
+                        Path(audio_path).unlink(missing_ok=True)
+                complete = True
+                return result
+            finally:
+                progress.finish(complete)
+        
+        if not self._whisper_available():
+            return None
+        
+        # A failed edit sets self._cancelled, which stops this between segments
+        logger.info("Transcribing source audio in the background...")
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcribe")
+        future = executor.submit(transcribe_source)
+        executor.shutdown(wait=False)
+        return future
+    
+    def _edit_time_map(self, chunks: List[ChunkInfo]) -> Optional[List[Tuple[float, float, float, float]]]:
+        """Source -> output time pieces (src_start, src_end, out_start, out_end) for the whole edit"""
+        speed = self.config.speed_multiplier
+        pieces = []
+        out_offset = 0.0
+        for chunk in chunks:
+            if chunk.keep is None:
+                return None
+            
+            actual = chunk.output_duration or self._get_video_duration(chunk.output_path)
+            expected = sum(end - start for start, end in chunk.keep) / speed
+            # Frame rounding makes each chunk a little off; spread the difference evenly
+            scale = actual / expected if expected else 1.0
+            
+            position = out_offset
+            for start, end in chunk.keep:
+                length = (end - start) / speed * scale
+                pieces.append((chunk.start_time + start, chunk.start_time + end, position, position + length))
+                position += length
+            out_offset += actual
+        
+        return pieces
+    
+    def _finish_source_transcription(self, future, chunks: List[ChunkInfo], output_srt: str) -> Optional[str]:
+        """Wait for the background transcript and move it onto the edited timeline"""
+        try:
+            segments, _ = future.result()
+        except Exception as e:
+            logger.warning(f"Background transcription failed: {e}")
+            return None
+        
+        pieces = self._edit_time_map(chunks)
+        if pieces is None:
+            logger.warning("Edit cuts aren't known up front, transcribing the edited video instead")
+            return None
+        
+        segments = remap_segments(segments, pieces)
+        text = ' '.join(seg["text"] for seg in segments if seg["text"])
+        txt_path = self._write_transcript(segments, text, output_srt)
+        logger.info(f"Subtitles saved: {output_srt}")
+        logger.info(f"Transcript saved: {txt_path}")
+        return text
+    
+    def _whisper_server_available(self) -> bool:
+        """Whether a whisper_server.py instance answers at whisper_server_url (probed once per editor)"""
+        if self._whisper_server_up is None:
+            self._whisper_server_up = self._probe_whisper_server()
+        return self._whisper_server_up
+    
+    def _probe_whisper_server(self) -> bool:
+        """Health check of the whisper server"""
+        if not self.config.whisper_server_url:
+            return False
+        try:
+            health_url = f"{self.config.whisper_server_url.rstrip('/')}/health"
+            with _local_opener.open(health_url, timeout=WHISPER_SERVER_PROBE_TIMEOUT) as response:
+                return response.status == 200
+        except (OSError, ValueError):
+            return False
+    
+    def _whisper_available(self) -> bool:
+        """Whether transcription can run, through the server or a local install"""
+        if self._whisper_server_available():
+            return True
+        try:
+            import whisper
+            import torch
+        except ImportError:
+            return False
+        return True
+    
+    def _transcribe_via_server(self, audio_path: str,
+                               duration: float) -> Optional[Tuple[List[Dict[str, Any]], str]]:
+        """Transcribe with the warm model server, or None to transcribe locally"""
+        request = urllib.request.Request(
+            f"{self.config.whisper_server_url.rstrip('/')}/transcribe",
+            data=json.dumps({
+                "audio_path": str(Path(audio_path).resolve()),
+                "model": self.config.whisper_model,
+            }).encode('utf-8'),
+            headers={"Content-Type": "application/json"}
+        )
+        
+        logger.info("Transcribing audio with the Whisper server...")
+        try:
+            # A stuck server times out (TimeoutError is an OSError) instead of blocking the edit
+            with _local_opener.open(request, timeout=max(WHISPER_SERVER_TIMEOUT, duration)) as response:
+                result = json.loads(response.read().decode('utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Whisper server failed, transcribing locally: {e}")
+            # Don't wait on it again for the rest of this run
+            self._whisper_server_up = False
+            return None
+        
+        return result["segments"], result["text"]
+    
+    def _transcribe_workers(self, duration: float) -> int:
+        """How many Whisper processes are worth starting for this much audio"""
+        workers = self.config.transcribe_workers or (os.cpu_count() or 1)
+        return max(1, min(workers, int(duration // TRANSCRIBE_MIN_SEGMENT)))
+    
+    def _transcribe_audio(self, audio_path: str,
+                          progress: Optional[TranscriptProgress] = None) -> Tuple[List[Dict[str, Any]], str]:
+        """Whisper segments ({start, end, text}) and full text of a 16 kHz mono WAV"""
+        # The WAV is decoded deterministically, so its hash identifies the audio
+        cache_key = self.result_cache.key(
+            sha256_file(audio_path), "transcript",
+            {"model": self.config.whisper_model, "options": WHISPER_OPTIONS}
+        )
+        cached = self.result_cache.load_json(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached transcript for identical audio")
+            if progress is not None:
+                progress.update(cached["text"])
+            return cached["segments"], cached["text"]
+        
+        segments, text = self._run_whisper(audio_path, progress)
+        self.result_cache.save_json(cache_key, {"segments": segments, "text": text})
+        return segments, text
+    
+    def _run_whisper(self, audio_path: str,
+                     progress: Optional[TranscriptProgress] = None) -> Tuple[List[Dict[str, Any]], str]:
+        """Transcribe with the server, a process pool or a single in-process model"""
+        with wave.open(audio_path, 'rb') as wav:
+            duration = wav.getnframes() / wav.getframerate()
+        
+        if self._whisper_server_available():
+            result = self._transcribe_via_server(audio_path, duration)
+            if result is not None:
+                if progress is not None:
+                    progress.update(result[1])
+                return result
+        
+        workers = self._transcribe_workers(duration)
+        if workers > 1:
+            return self._transcribe_audio_parallel(audio_path, duration, workers, progress)
+        
+        # One model per process, shared between videos; transcriptions take turns
+        with _shared_whisper_lock:
+            self._check_cancelled()
+            if self.config.whisper_model not in _shared_whisper_models:
+                # Model will be cached in ~/.cache/whisper/ for future runs
+                logger.info("Loading Whisper model (will cache for future runs)...")
+            model = shared_whisper_model(self.config.whisper_model)
+            
+            # Transcribe with optimized settings for CI/CD
+            logger.info("Transcribing audio...")
+            result = model.transcribe(audio_path, **WHISPER_OPTIONS)
+        
+        segments = [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"].strip()}
+            for seg in result["segments"]
+        ]
+        text = result["text"].strip()
+        if progress is not None:
+            progress.update(text)
+        return segments, text
+    
+    def _transcribe_audio_parallel(self, audio_path: str, duration: float, workers: int,
+                                   progress: Optional[TranscriptProgress] = None) -> Tuple[List[Dict[str, Any]], str]:
+        """Split the WAV at quiet points and transcribe the pieces across a process pool"""
+        analysis = analyze_audio_levels(audio_path, sample_rate=WHISPER_SAMPLE_RATE)
+        # At least one segment per worker, more for long audio (see TRANSCRIBE_SEGMENT)
+        count = max(workers, math.ceil(duration / TRANSCRIBE_SEGMENT))
+        points = silence_split_points(analysis["rms_db"], analysis["window"], duration, count)
+        bounds = list(zip([0.0] + points, points + [duration]))
+        
+        pool = self.transcribe_pool
+        if pool is not None:
+            logger.info(f"Transcribing {len(bounds)} segments on the shared Whisper workers...")
+        else:
+            logger.info(f"Transcribing {len(bounds)} segments with {workers} Whisper workers...")
+            pool = whisper_pool(self.config.whisper_model, workers)
+        futures = [pool.submit(_transcribe_wav_segment, audio_path, start, end) for start, end in bounds]
+        try:
+            # Collected in order, so the text so far is always the start of the transcript
+            segments = []
+            for future in futures:
+                while not wait([future], timeout=1.0).done:
+                    self._check_cancelled()
+                segments += future.result()
+                if progress is not None:
+                    progress.update(' '.join(seg["text"] for seg in segments if seg["text"]))
+        finally:
+            # After a cancel or an error, drop the queued segments; only running ones still finish
+            for future in futures:
+                future.cancel()
+            if pool is not self.transcribe_pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+        
+        text = ' '.join(seg["text"] for seg in segments if seg["text"])
+        return segments, text
+    
+    def _check_cancelled(self):
+        """Stop background work once the edit has failed (raises CancelledError)"""
+        if self._cancelled.is_set():
+            raise CancelledError("edit failed, background work cancelled")
+    
+    def _write_transcript(self, segments: List[Dict[str, Any]], text: str, output_srt: str) -> Path:
+        """Save segments as SRT and the full text as .txt (for AI metadata); returns the .txt path"""
+        write_srt(segments, output_srt)
+        
+        txt_path = Path(output_srt).with_suffix('.txt')
+        with open(txt_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return txt_path
     
     def _generate_metadata_ai(self, transcript: str, api_key: str) -> Optional[Dict]:
         """Generate YouTube metadata using OpenRouter DeepSeek API (optimized for GitHub Actions)"""
         logger.info("Generating YouTube metadata with DeepSeek AI...")
         
+        # Truncate transcript to avoid token limits (keep first 2000 chars)
+        truncated_transcript = transcript[:METADATA_TRANSCRIPT_CHARS]
+        if len(transcript) > METADATA_TRANSCRIPT_CHARS:
+            truncated_transcript += "..."
+        
+        # Only the truncated text reaches the model, so it alone decides the answer
+        cache_key = self.result_cache.key(
+            hashlib.sha256(truncated_transcript.encode('utf-8')).hexdigest(), "metadata",
+            {"model": METADATA_MODEL, "prompt_version": METADATA_PROMPT_VERSION}
+        )
+        cached = self.result_cache.load_json(cache_key)
+        if cached is not None:
+            logger.info("✅ Reusing cached AI metadata for this transcript")
+            return cached
+        
         try:
             import requests
         except ImportError:
             logger.warning("requests not installed. Install with: pip install requests")
             return None
         
-        # Truncate transcript to avoid token limits (keep first 2000 chars)
-        truncated_transcript = transcript[:2000]
-        if len(transcript) > 2000:
-            truncated_transcript += "..."
-        
         prompt = f"""Based on this video transcription, generate YouTube metadata in JSON format.
 
 Transcription:
@@ -846,95 +3015,185 @@ Return ONLY valid JSON in this exact format:
   "hashtags": ["#hashtag1", "#hashtag2", ... 10 hashtags total]
 }}"""
         
-        # Retry logic for GitHub Actions (network can be flaky)
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"API request attempt {attempt + 1}/{max_retries}...")
-                
-                response = requests.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                        "HTTP-Referer": "https://github.com",  # Optional: for OpenRouter analytics
-                        "X-Title": "Auto Video Editor"  # Optional: app name
-                    },
-                    json={
-                        "model": "deepseek/deepseek-chat",
-                        "messages": [
-                            {"role": "system", "content": "You are a YouTube SEO expert. Always respond with valid JSON only."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.7,
-                        "max_tokens": 2000  # Increased for 25 tags + 10 hashtags
-                    },
-                    timeout=60  # Longer timeout for GitHub Actions
-                )
+        # One session for every attempt: retries reuse the TLS connection. Network errors,
+        # 429s, 5xx and unusable answers are retried with jittered exponential backoff;
+        # no attempt starts after the deadline and each one's timeout is capped by what's left
+        deadline = time.monotonic() + METADATA_DEADLINE
+        with requests.Session() as session:
+            for attempt in range(METADATA_MAX_ATTEMPTS):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 
-                if response.status_code == 200:
-                    content = response.json()['choices'][0]['message']['content']
-                    
-                    # Extract JSON from response (handle markdown code blocks)
-                    import re
-                    # Try to find JSON in code block first
-                    code_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-                    if code_block_match:
-                        json_str = code_block_match.group(1)
-                    else:
-                        # Try to find raw JSON
-                        json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                        if json_match:
-                            json_str = json_match.group()
-                        else:
-                            logger.warning("No JSON found in AI response")
-                            continue
+                retry_after = None
+                try:
+                    logger.info(f"API request attempt {attempt + 1}/{METADATA_MAX_ATTEMPTS}...")
                     
-                    # Parse JSON
-                    metadata = json.loads(json_str)
+                    response = session.post(
+                        "https://openrouter.ai/api/v1/chat/completions",
+                        headers={
+                            "Authorization": f"Bearer {api_key}",
+                            "Content-Type": "application/json",
+                            "HTTP-Referer": "https://github.com",  # Optional: for OpenRouter analytics
+                            "X-Title": "Auto Video Editor"  # Optional: app name
+                        },
+                        json={
+                            "model": METADATA_MODEL,
+                            "messages": [
+                                {"role": "system", "content": "You are a YouTube SEO expert. Always respond with valid JSON only."},
+                                {"role": "user", "content": prompt}
+                            ],
+                            "temperature": 0.7,
+                            "max_tokens": 2000  # Increased for 25 tags + 10 hashtags
+                        },
+                        timeout=(min(METADATA_CONNECT_TIMEOUT, remaining), remaining)
+                    )
                     
-                    # Validate required fields
-                    required_fields = ['title', 'description', 'tags', 'hashtags']
-                    if all(field in metadata for field in required_fields):
-                        logger.info("✅ AI metadata generated successfully!")
-                        return metadata
+                    if response.status_code == 200:
+                        metadata = self._parse_metadata_response(response.json()['choices'][0]['message']['content'])
+                        if metadata is not None:
+                            logger.info("✅ AI metadata generated successfully!")
+                            self.result_cache.save_json(cache_key, metadata)
+                            return metadata
+                    elif response.status_code == 429 or response.status_code >= 500:
+                        logger.warning(f"API request failed: {response.status_code}, retrying")
+                        retry_after = response.headers.get("Retry-After")
                     else:
-                        logger.warning(f"Missing required fields in metadata: {metadata.keys()}")
-                        continue
-                        
-                elif response.status_code == 429:
-                    logger.warning("Rate limited, waiting 5 seconds...")
-                    import time
-                    time.sleep(5)
-                    continue
-                else:
-                    logger.warning(f"API request failed: {response.status_code} - {response.text}")
-                    if attempt < max_retries - 1:
-                        import time
-                        time.sleep(2)
-                        continue
-                    return None
+                        # Bad key, bad request...: retrying won't help
+                        logger.warning(f"API request failed: {response.status_code} - {response.text}")
+                        return None
                     
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(2)
-                    continue
-                return None
-            except Exception as e:
-                logger.warning(f"AI metadata generation error: {e}")
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(2)
-                    continue
-                return None
+                except requests.exceptions.Timeout:
+                    logger.warning(f"Request timeout (attempt {attempt + 1}/{METADATA_MAX_ATTEMPTS})")
+                except (requests.exceptions.RequestException, ValueError, KeyError, IndexError) as e:
+                    logger.warning(f"AI metadata generation error: {e}")
+                
+                delay = metadata_backoff(attempt, retry_after)
+                if time.monotonic() + delay >= deadline:
+                    break
+                time.sleep(delay)
         
         logger.warning("All retry attempts failed")
         return None
     
+    def _parse_metadata_response(self, content: str) -> Optional[Dict]:
+        """Metadata JSON from the model's answer, or None if it's missing or incomplete"""
+        # Extract JSON from response (handle markdown code blocks)
+        import re
+        # Try to find JSON in code block first
+        code_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        if code_block_match:
+            json_str = code_block_match.group(1)
+        else:
+            # Try to find raw JSON
+            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            if not json_match:
+                logger.warning("No JSON found in AI response")
+                return None
+            json_str = json_match.group()
+        
+        # Parse JSON
+        metadata = json.loads(json_str)
+        
+        # Validate required fields
+        required_fields = ['title', 'description', 'tags', 'hashtags']
+        if not all(field in metadata for field in required_fields):
+            logger.warning(f"Missing required fields in metadata: {metadata.keys()}")
+            return None
+        return metadata
+    
+    def _start_metadata_generation(self, get_transcript) -> Future:
+        """Generate the AI metadata on a background thread; the future gives (transcript used, metadata)
+        
+        get_transcript may block (e.g. until the background transcription has
+        enough text); the request itself starts as soon as it returns text.
+        Without a transcript, or once the edit has failed, the result is (None, None).
+        """
+        def generate():
+            try:
+                transcript = get_transcript()
+            except Exception as e:
+                logger.warning(f"No transcript for early AI metadata: {e}")
+                return None, None
+            if not transcript or self._cancelled.is_set():
+                return None, None
+            with self.metrics.stage("metadata_request"):
+                return transcript, self._generate_metadata_ai(transcript, self.config.openrouter_api_key)
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metadata")
+        future = executor.submit(generate)
+        executor.shutdown(wait=False)
+        return future
+    
     def run(self) -> bool:
         """Run the complete editing pipeline"""
+        success = False
+        try:
+            success = self._run_pipeline()
+            return success
+        finally:
+            if not success:
+                # Don't let background transcription or a paid metadata request outlive a failed edit
+                self._cancelled.set()
+            self._save_metrics(success)
+    
+    def _save_metrics(self, success: bool):
+        """Store this run's metrics in the state file and write them as a report in work/reports"""
+        try:
+            media_seconds = self._get_video_duration(self.config.input_video)
+        except Exception:
+            media_seconds = 0.0
+        report = {
+            "input": self.config.input_video,
+            "output": self.config.output_video,
+            "success": success,
+            **self.metrics.report(media_seconds)
+        }
+        
+        with self._state_lock:
+            self.state["metrics"] = report
+            self._save_state()
+        
+        reports_dir = self.work_dir / "reports"
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        report_file = reports_dir / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        logger.info(f"Run metrics ({report['wall_seconds']:.1f}s, {report['realtime']:.2f}x realtime): {report_file}")
+        for name, stage in sorted(report["stages"].items(), key=lambda item: -item[1]["wall_seconds"]):
+            logger.info(
+                f"  {name:<22} {stage['wall_seconds']:8.2f}s wall  "
+                f"{stage['child_user_seconds'] + stage['child_system_seconds'] + stage['python_cpu_seconds']:8.2f}s cpu  "
+                f"{stage['peak_rss_mb']:7.1f} MB peak"
+            )
+    
+    def _restore_consumed_steps(self, chunks: List[ChunkInfo]):
+        """On resume, redo completed steps whose outputs were already cleaned up but are needed again"""
+        completed = self.state["completed_steps"]
+        if "finishing" in completed and Path(self.config.output_video).exists():
+            return
+        
+        concat_output = self.state["metadata"].get("concat_output")
+        if "concatenation" in completed and not (concat_output and Path(concat_output).exists()):
+            logger.info("Concatenated video was cleaned up, redoing concatenation")
+            completed.remove("concatenation")
+        if "concatenation" in completed:
+            return
+        
+        for chunk in chunks:
+            if chunk.processed and not Path(chunk.output_path).exists():
+                chunk.processed = False
+        if "chunk_splitting" in completed and any(
+                not chunk.processed and not Path(chunk.input_path).exists() for chunk in chunks):
+            logger.info("Chunk inputs were cleaned up, splitting again")
+            completed.remove("chunk_splitting")
+        
+        self.state["chunks"] = [asdict(chunk) for chunk in chunks]
+        self._save_state()
+    
+    def _run_pipeline(self) -> bool:
+        """The editing steps of run(), resuming from the saved state"""
         try:
             logger.info("=" * 60)
             logger.info("Starting Auto Video Editor")
@@ -943,7 +3202,9 @@ Return ONLY valid JSON in this exact format:
             logger.info(f"Output: {self.config.output_video}")
             
             # Validate input video hasn't changed
-            current_input_checksum = self._calculate_checksum(self.config.input_video)
+            with self.metrics.stage("input_checksum"):
+                current_input_checksum = self._calculate_checksum(self.config.input_video)
+            duration = self._get_video_duration(self.config.input_video)
             saved_input_checksum = self.state.get("metadata", {}).get("input_checksum")
             
             if saved_input_checksum and saved_input_checksum != current_input_checksum:
@@ -958,9 +3219,9 @@ Return ONLY valid JSON in this exact format:
                 }
                 self._save_state()
                 # Clear old chunks
-                if self.chunk_dir.exists():
-                    shutil.rmtree(self.chunk_dir)
-                    self.chunk_dir.mkdir(parents=True, exist_ok=True)
+                if self.chunks_dir.exists():
+                    shutil.rmtree(self.chunks_dir)
+                    self.chunks_dir.mkdir(parents=True, exist_ok=True)
                 if self.temp_dir.exists():
                     shutil.rmtree(self.temp_dir)
                     self.temp_dir.mkdir(parents=True, exist_ok=True)
@@ -968,83 +3229,96 @@ Return ONLY valid JSON in this exact format:
                 # First run, save checksum
                 self.state["metadata"]["input_checksum"] = current_input_checksum
                 self._save_state()
+            # The checksum above only detects a changed input (in fast mode it includes the
+            # mtime); the content caches are rooted on the input's bytes alone
+            if self.config.checksum_mode == "sha256":
+                self._content_keys[self.config.input_video] = current_input_checksum
+            else:
+                self._content_keys[self.config.input_video] = content_fingerprint(self.config.input_video)
             
             # Step 1: Calculate chunks
             if "chunk_calculation" not in self.state.get("completed_steps", []):
-                chunks = self._calculate_chunks()
+                with self.metrics.stage("chunk_calculation"):
+                    chunks = self._calculate_chunks()
                 self.state["completed_steps"].append("chunk_calculation")
                 self._save_state()
             else:
                 chunks = [ChunkInfo(**c) for c in self.state["chunks"]]
             
             logger.info(f"Total chunks: {len(chunks)}")
+            self._restore_consumed_steps(chunks)
             
             # Step 2: Split video into chunks
             if "chunk_splitting" not in self.state.get("completed_steps", []):
-                self._split_into_chunks(chunks)
+                with self.metrics.stage("chunk_splitting", duration):
+                    self._split_into_chunks(chunks)
                 self.state["completed_steps"].append("chunk_splitting")
                 self._save_state()
             
-            # Step 3: Process each chunk
-            for chunk in chunks:
-                if not chunk.processed:
-                    success = self._process_chunk(chunk)
-                    if not success:
-                        logger.error(f"Failed to process chunk {chunk.chunk_id}")
-                        return False
-                    
-                    # Update state
-                    for i, state_chunk in enumerate(self.state["chunks"]):
-                        if state_chunk["chunk_id"] == chunk.chunk_id:
-                            self.state["chunks"][i] = asdict(chunk)
-                            break
-                    self._save_state()
+            # Speed and cuts are known per chunk, so the transcript can be made from
+            # the source now and mapped onto the edited timeline afterwards
+            transcription = None
+            source_text = TranscriptProgress()
+            if (self.config.extract_subtitles and self.config.transcribe_during_edit
+                    and "subtitle_extraction" not in self.state.get("completed_steps", [])):
+                transcription = self._start_source_transcription(source_text)
+            
+            # The metadata prompt only uses the start of the transcript: request it as soon as
+            # that much is transcribed, so the LLM round trip overlaps chunk processing
+            metadata_future = None
+            if (self.config.generate_metadata and self.config.openrouter_api_key
+                    and "metadata_generation" not in self.state.get("completed_steps", [])):
+                saved_transcript = self.state["metadata"].get("transcript")
+                if transcription is not None:
+                    # One character more than the prompt uses, so it's truncated like the full text
+                    metadata_future = self._start_metadata_generation(
+                        lambda: source_text.wait_for(METADATA_TRANSCRIPT_CHARS + 1)
+                    )
+                elif saved_transcript:
+                    metadata_future = self._start_metadata_generation(lambda: saved_transcript)
+            
+            # One loudness measurement for the whole program gives every chunk the same gain
+            if self.config.add_sound_effects:
+                with self.metrics.stage("loudness_measurement", duration):
+                    self.loudness = self._measure_loudness(self.config.input_video)
+            
+            # Step 3: Process chunks (in parallel, up to max_workers)
+            pending = sum(chunk.duration for chunk in chunks if not chunk.processed)
+            with self.metrics.stage("chunk_processing", pending):
+                if not self._process_chunks_parallel(chunks):
+                    return False
             
             # Step 4: Concatenate chunks
             if "concatenation" not in self.state.get("completed_steps", []):
                 concat_output = str(self.temp_dir / "concatenated.mp4")
-                self._concatenate_chunks(chunks, concat_output)
+                with self.metrics.stage("concatenation"):
+                    self._concatenate_chunks(chunks, concat_output)
                 self.state["completed_steps"].append("concatenation")
                 self.state["metadata"]["concat_output"] = concat_output
                 self._save_state()
+                for chunk in chunks:
+                    self._discard(chunk.output_path)
             else:
                 concat_output = self.state["metadata"]["concat_output"]
             
-            # Step 5: Add subtitles
-            if self.config.add_subtitles and "subtitles" not in self.state.get("completed_steps", []):
-                subtitle_output = str(self.temp_dir / "with_subtitles.mp4")
-                self._add_subtitles(concat_output, subtitle_output)
-                concat_output = subtitle_output
-                self.state["completed_steps"].append("subtitles")
-                self._save_state()
-            
-            # Step 6: Add subscribe popup
-            if self.config.add_subscribe_popup and "subscribe" not in self.state.get("completed_steps", []):
-                subscribe_output = str(self.temp_dir / "with_subscribe.mp4")
-                self._add_subscribe_popup(concat_output, subscribe_output)
-                concat_output = subscribe_output
-                self.state["completed_steps"].append("subscribe")
-                self._save_state()
-            
-            # Step 7: Add background music
-            if self.config.background_music and "background_music" not in self.state.get("completed_steps", []):
-                music_output = str(self.temp_dir / "with_music.mp4")
-                self._add_background_music(concat_output, music_output)
-                concat_output = music_output
-                self.state["completed_steps"].append("background_music")
+            # Steps 5-8: Subtitles, subscribe popup, background music and final output
+            if "finishing" not in self.state.get("completed_steps", []) or not Path(self.config.output_video).exists():
+                with self.metrics.stage("finishing", self._get_video_duration(concat_output)):
+                    self._finish_video(concat_output, self.config.output_video)
+                if "finishing" not in self.state["completed_steps"]:
+                    self.state["completed_steps"].append("finishing")
                 self._save_state()
-            
-            # Step 8: Final copy to output
-            logger.info("Creating final output...")
-            # Ensure output directory exists
-            Path(self.config.output_video).parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(concat_output, self.config.output_video)
+                self._discard(concat_output)
             
             # Step 9: Extract subtitles (NEW!)
             transcript = None
             if self.config.extract_subtitles and "subtitle_extraction" not in self.state.get("completed_steps", []):
                 output_srt = Path(self.config.output_video).with_suffix('.srt')
-                transcript = self._extract_subtitles_whisper(self.config.output_video, str(output_srt))
+                with self.metrics.stage("subtitle_extraction"):
+                    if transcription is not None:
+                        transcript = self._finish_source_transcription(transcription, chunks, str(output_srt))
+                    if not transcript:
+                        transcript = self._extract_subtitles_whisper(self.config.output_video, str(output_srt))
                 if transcript:
                     self.state["completed_steps"].append("subtitle_extraction")
                     self.state["metadata"]["transcript"] = transcript
@@ -1056,7 +3330,13 @@ Return ONLY valid JSON in this exact format:
             # Step 10: Generate AI metadata (NEW!)
             if self.config.generate_metadata and transcript and self.config.openrouter_api_key:
                 if "metadata_generation" not in self.state.get("completed_steps", []):
-                    metadata = self._generate_metadata_ai(transcript, self.config.openrouter_api_key)
+                    with self.metrics.stage("metadata_generation"):
+                        used_transcript, metadata = None, None
+                        if metadata_future is not None:
+                            used_transcript, metadata = metadata_future.result()
+                        if used_transcript is None:
+                            # Nothing to start from early (e.g. the transcript came from the output)
+                            metadata = self._generate_metadata_ai(transcript, self.config.openrouter_api_key)
                     if metadata:
                         # Save metadata to JSON file
                         metadata_file = Path(self.config.output_video).with_suffix('.metadata.json')
@@ -1086,6 +3366,185 @@ def load_manifest(manifest_path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+def edited_output_path(video: Path, edited_dir: str = "edited") -> Path:
+    """Output path for a downloaded video (spaces become underscores, _EDITED suffix)"""
+    output_name = video.stem.replace(" ", "_") + "_EDITED.mp4"
+    return Path(edited_dir) / output_name
+
+
+def find_unedited_videos(downloads_dir: str = "downloads") -> List[Tuple[str, str]]:
+    """(input, output) for every downloaded video without an edited output yet, oldest first"""
+    downloads_path = Path(downloads_dir)
+    if not downloads_path.exists():
+        logger.error(f"Downloads folder not found: {downloads_dir}")
+        return []
+    
+    videos = sorted(downloads_path.glob("*.mp4"), key=lambda p: p.stat().st_mtime)
+    return [
+        (str(video), str(edited_output_path(video)))
+        for video in videos
+        if not edited_output_path(video).exists()
+    ]
+
+
+def video_work_dir(work_root: Path, input_video: str) -> Path:
+    """Per-video work directory, named after the input's fingerprint"""
+    return work_root / fast_fingerprint(input_video).split(':', 1)[1][:16]
+
+
+def edit_video(config: EditConfig, work_root: Path, resume: bool = False,
+               chunk_pool: Optional[ThreadPoolExecutor] = None,
+               transcribe_pool: Optional[ProcessPoolExecutor] = None) -> bool:
+    """Edit one video in its own work directory, holding that directory's state lock
+    
+    Editors working on different inputs never share files, so any number of
+    them (processes or batch threads) can run at once; the shared cache is
+    content-addressed and written atomically.
+    """
+    work_dir = video_work_dir(work_root, config.input_video)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    
+    state_lock = FileLock(work_dir / "edit_state.json.lock")
+    if not state_lock.acquire(blocking=False):
+        logger.error(f"Another editor is already working on {config.input_video} ({work_dir})")
+        return False
+    
+    try:
+        # Clear state if not resuming
+        state_file = work_dir / "edit_state.json"
+        if not resume and state_file.exists():
+            state_file.unlink()
+        
+        editor = VideoEditor(config, work_dir, cache_dir=work_root / "cache", chunk_pool=chunk_pool,
+                             transcribe_pool=transcribe_pool)
+        return editor.run()
+    finally:
+        state_lock.release()
+
+
+# Preview renders: proxy height and the encoding profile used for the whole preview edit
+PREVIEW_HEIGHT = 360
+PREVIEW_PROFILE = "ci-fast"
+
+
+def build_preview_proxy(input_video: str, proxy_path: Path, height: int = PREVIEW_HEIGHT,
+                        start: float = 0.0, duration: Optional[float] = None):
+    """Downscaled copy of the input (optionally just start..start+duration) to preview edits on"""
+    window = ['-ss', str(start)] if start else []
+    if duration:
+        window += ['-t', str(duration)]
+    
+    partial_path = proxy_path.with_suffix('.partial.mp4')
+    cmd = [
+        'ffmpeg',
+        *window,
+        '-i', input_video,
+        '-vf', f'scale=-2:{height}',
+        *ENCODING_PROFILES[PREVIEW_PROFILE].intermediate_video,
+        *CONCAT_VIDEO_ARGS,
+        *ENCODING_PROFILES[PREVIEW_PROFILE].intermediate_audio,
+        *CONCAT_AUDIO_ARGS,
+        '-y',
+        str(partial_path)
+    ]
+    run_process(cmd)
+    os.replace(partial_path, proxy_path)
+    
+    # Finishing burns in the input's .srt: give the proxy the same cues, on its own timeline
+    source_srt = Path(input_video).with_suffix('.srt')
+    if source_srt.exists():
+        end = start + duration if duration else probe_media(input_video).duration
+        segments = remap_segments(read_srt(str(source_srt)), [(start, end, 0.0, end - start)])
+        if segments:
+            write_srt(segments, str(proxy_path.with_suffix('.srt')))
+
+
+def edit_preview(config: EditConfig, work_root: Path, resume: bool = False, height: int = PREVIEW_HEIGHT,
+                 start: float = 0.0, duration: Optional[float] = None) -> bool:
+    """Run the full edit (same chunk stages and finishing) on a low resolution proxy
+    
+    The preview is written next to the real output with a _PREVIEW suffix and
+    has its own work directory, so the full resolution run is left untouched.
+    """
+    proxy_dir = video_work_dir(work_root, config.input_video) / "preview"
+    proxy_dir.mkdir(parents=True, exist_ok=True)
+    window = f"_{start:g}s_{duration:g}s" if duration else (f"_{start:g}s" if start else "")
+    proxy_path = proxy_dir / f"proxy_{height}p{window}.mp4"
+    
+    if proxy_path.exists():
+        logger.info(f"Reusing preview proxy: {proxy_path}")
+    else:
+        logger.info(f"Building {height}p preview proxy...")
+        build_preview_proxy(config.input_video, proxy_path, height, start, duration)
+    
+    output = Path(config.output_video)
+    preview = replace(
+        config,
+        input_video=str(proxy_path),
+        output_video=str(output.with_name(f"{output.stem}_PREVIEW{output.suffix}")),
+        encoding_profile=PREVIEW_PROFILE,
+        # Size the subscribe popup as it will look on the full resolution output
+        popup_reference_height=config.popup_reference_height or probe_media(config.input_video).height,
+        # Transcripts and AI metadata don't change how the effects look
+        extract_subtitles=False,
+        generate_metadata=False
+    )
+    return edit_video(preview, work_root, resume)
+
+
+def run_batch(config_data: Dict[str, Any], work_root: Path, resume: bool = False) -> int:
+    """Edit every unedited download in one process, sharing workers and caches"""
+    videos = find_unedited_videos()
+    if not videos:
+        logger.info("No unedited videos found in downloads/")
+        return 0
+    
+    configs = [
+        EditConfig(**{**config_data, 'input_video': input_path, 'output_video': output_path})
+        for input_path, output_path in videos
+    ]
+    workers = max(1, min(configs[0].max_workers, os.cpu_count() or 1))
+    
+    logger.info("=" * 60)
+    logger.info(f"BATCH MODE: {len(configs)} video(s) to edit, {workers} shared worker(s)")
+    for config in configs:
+        logger.info(f"  {config.input_video} -> {config.output_video}")
+    logger.info("=" * 60)
+    
+    # Long transcriptions share one Whisper process pool (workers start on first use),
+    # so concurrent videos don't each load the model in cpu_count new processes
+    transcribe_workers = configs[0].transcribe_workers or (os.cpu_count() or 1)
+    transcribe_pool = None
+    if configs[0].extract_subtitles and transcribe_workers > 1:
+        transcribe_pool = whisper_pool(configs[0].whisper_model, transcribe_workers)
+    
+    # Probe results, cached stages, loudness and transcripts, the Whisper
+    # models and the chunk workers are all shared between the videos
+    failed = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk") as chunk_pool, \
+                ThreadPoolExecutor(max_workers=min(workers, len(configs)), thread_name_prefix="video") as video_pool:
+            futures = {
+                video_pool.submit(edit_video, config, work_root, resume, chunk_pool, transcribe_pool): config
+                for config in configs
+            }
+            for future in as_completed(futures):
+                config = futures[future]
+                if not future.result():
+                    failed.append(config.input_video)
+    finally:
+        if transcribe_pool is not None:
+            transcribe_pool.shutdown(wait=False, cancel_futures=True)
+    
+    logger.info("=" * 60)
+    logger.info(f"Batch finished: {len(configs) - len(failed)}/{len(configs)} video(s) edited")
+    for input_video in failed:
+        logger.error(f"  Failed: {input_video}")
+    logger.info("=" * 60)
+    
+    return 0 if not failed else 1
+
+
 def auto_detect_latest_video(downloads_dir: str = "downloads") -> Optional[Tuple[str, str]]:
     """
     Auto-detect the latest video in downloads folder
@@ -1108,10 +3567,7 @@ def auto_detect_latest_video(downloads_dir: str = "downloads") -> Optional[Tuple
     
     # Get the most recent file by modification time
     latest_video = max(mp4_files, key=lambda p: p.stat().st_mtime)
-    
-    # Generate output filename (replace spaces with underscores, add _EDITED)
-    output_name = latest_video.stem.replace(" ", "_") + "_EDITED.mp4"
-    output_path = Path("edited") / output_name
+    output_path = edited_output_path(latest_video)
     
     logger.info("=" * 60)
     logger.info("AUTO-DETECTED VIDEO:")
@@ -1144,6 +3600,34 @@ def main():
         action='store_true',
         help='Resume from previous state'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Edit every video in downloads/ without an edited output (manifest paths are ignored)'
+    )
+    parser.add_argument(
+        '--preview',
+        action='store_true',
+        help='Render a quick low resolution preview (<output>_PREVIEW.mp4) instead of the full edit'
+    )
+    parser.add_argument(
+        '--preview-height',
+        type=int,
+        default=PREVIEW_HEIGHT,
+        help=f'Height of the preview proxy in pixels (default: {PREVIEW_HEIGHT})'
+    )
+    parser.add_argument(
+        '--preview-start',
+        type=float,
+        default=0.0,
+        help='Preview only from this many seconds into the input (default: 0)'
+    )
+    parser.add_argument(
+        '--preview-duration',
+        type=float,
+        default=None,
+        help='Preview only this many seconds of the input (default: all of it)'
+    )
     
     args = parser.parse_args()
     
@@ -1153,6 +3637,9 @@ def main():
     # Filter out comment fields (starting with _)
     config_data = {k: v for k, v in manifest.items() if not k.startswith('_')}
     
+    if args.batch:
+        return run_batch(config_data, Path(args.work_dir), args.resume)
+    
     # Auto-detect video if needed
     if config_data.get('input_video') == 'AUTO_DETECT' or config_data.get('output_video') == 'AUTO_DETECT':
         logger.info("Auto-detection enabled in manifest...")
@@ -1180,19 +3667,13 @@ def main():
         logger.error(f"Input video not found: {config.input_video}")
         return 1
     
-    # Create work directory
-    work_dir = Path(args.work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Clear state if not resuming
-    if not args.resume:
-        state_file = work_dir / "edit_state.json"
-        if state_file.exists():
-            state_file.unlink()
+    if args.preview:
+        success = edit_preview(config, Path(args.work_dir), args.resume, args.preview_height,
+                               args.preview_start, args.preview_duration)
+        return 0 if success else 1
     
-    # Run editor
-    editor = VideoEditor(config, work_dir)
-    success = editor.run()
+    # Run editor in work/<input fingerprint>, so concurrent runs on other inputs don't collide
+    success = edit_video(config, Path(args.work_dir), resume=args.resume)
     
     return 0 if success else 1
 
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Editor Benchmarks
+Measures filter throughput of the auto editor on synthetic media, so each
+deployment can pick the settings its hardware can afford.
+
+Usage:
+    py bench_edit.py --zoom
+    py bench_edit.py --zoom --duration 20 --resolution 1920x1080
+    py bench_edit.py --profiles
+    py bench_edit.py --suite --json bench.json
+    py bench_edit.py --suite --durations 10,60 --resolutions 1280x720,1920x1080 --compare bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import threading
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from auto_edit import EditConfig, VideoEditor, ZOOM_MODES, ZOOM_FPS, ENCODING_PROFILES
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def generate_test_media(output_path: str, duration: float, resolution: str, fps: int = ZOOM_FPS,
+                        pauses: bool = False):
+    """Render deterministic test video + tone with ffmpeg's lavfi sources
+    
+    With pauses, the tone drops out for one second in every four, so silence
+    removal and jump cuts have something to cut.
+    """
+    audio_filter = ['-af', "volume='if(lt(mod(t,4),3),1,0)':eval=frame"] if pauses else []
+    cmd = [
+        'ffmpeg',
+        '-f', 'lavfi', '-i', f'testsrc2=size={resolution}:rate={fps}:duration={duration}',
+        '-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=44100:duration={duration}',
+        *audio_filter,
+        '-c:v', 'libx264',
+        '-preset', 'ultrafast',
+        '-g', str(fps),
+        '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac',
+        '-shortest',
+        '-y',
+        output_path
+    ]
+    subprocess.run(cmd, check=True, capture_output=True)
+
+
+def time_command(cmd: List[str]) -> float:
+    """Run a command and return its wall time in seconds"""
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def bench_zoom_modes(media_path: str, work_dir: Path, duration: float) -> List[Dict]:
+    """Filter-only fps of every zoom engine (no encode, output discarded)"""
+    config = EditConfig(input_video=media_path, output_video=str(work_dir / "unused.mp4"))
+    editor = VideoEditor(config, work_dir)
+    width, height = editor._get_video_dimensions(media_path)
+    frames = duration * ZOOM_FPS
+    
+    results = []
+    for mode in ZOOM_MODES:
+        config.zoom_mode = mode
+        zoom_filter = editor._zoom_filter(width, height, media_path, duration)
+        cmd = [
+            'ffmpeg',
+            '-i', media_path,
+            '-vf', zoom_filter,
+            '-an',
+            '-f', 'null',
+            '-'
+        ]
+        
+        logger.info(f"Benchmarking zoom mode '{mode}'...")
+        elapsed = time_command(cmd)
+        results.append({
+            "mode": mode,
+            "seconds": elapsed,
+            "fps": frames / elapsed if elapsed else 0.0,
+            "realtime": duration / elapsed if elapsed else 0.0
+        })
+    
+    return results
+
+
+def bench_encoding_profiles(media_path: str, work_dir: Path, duration: float) -> List[Dict]:
+    """Encode fps of each profile's intermediate and delivery settings on this host"""
+    frames = duration * ZOOM_FPS
+    
+    results = []
+    for name, profile in ENCODING_PROFILES.items():
+        encodes = [("intermediate", profile.intermediate_video + profile.intermediate_audio)]
+        if not profile.delivers_intermediate:
+            encodes.append(("delivery", profile.delivery_video + profile.delivery_audio))
+        
+        for stage, encode_args in encodes:
+            output_path = work_dir / f"profile_{name}_{stage}.mp4"
+            cmd = ['ffmpeg', '-i', media_path] + encode_args + ['-y', str(output_path)]
+            
+            logger.info(f"Benchmarking '{name}' {stage} encode...")
+            elapsed = time_command(cmd)
+            results.append({
+                "profile": name,
+                "stage": stage,
+                "seconds": elapsed,
+                "fps": frames / elapsed if elapsed else 0.0,
+                "realtime": duration / elapsed if elapsed else 0.0,
+                "size_mb": output_path.stat().st_size / (1024 * 1024)
+            })
+            output_path.unlink()
+    
+    return results
+
+
+def recommend_profile(results: List[Dict], duration: float) -> str:
+    """Highest quality profile whose encodes together still run at least at realtime"""
+    for name in ("archive", "balanced"):
+        seconds = sum(row["seconds"] for row in results if row["profile"] == name)
+        if seconds and duration / seconds >= 1.0:
+            return name
+    return "ci-fast"
+
+
+# Manifest settings benchmarked by --suite. Every preset runs offline: no Whisper, no AI
+# metadata, no artifact cache, so each run does the full work
+BENCH_BASE = {
+    "extract_subtitles": False,
+    "generate_metadata": False,
+    "whisper_server_url": "",
+    "artifact_cache_mb": 0,
+    "result_cache_mb": 0,
+    "chunk_duration": 30,
+}
+BENCH_PRESETS = {
+    "fused": {},
+    "piped": {"fuse_chunk_filters": False},
+    "steps": {"fuse_chunk_filters": False, "pipe_stages": False},
+    "ci-fast": {"encoding_profile": "ci-fast"},
+    "no-effects": {"apply_zoom_effects": False, "apply_transitions": False, "add_sound_effects": False},
+}
+
+
+class DiskMonitor:
+    """Samples the total size of a directory tree in the background and keeps the peak"""
+    
+    def __init__(self, path: Path, interval: float = 0.2):
+        self.path = path
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+    
+    def _usage(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass  # Renamed or deleted mid-walk
+        return total
+    
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, self._usage())
+            self._stop.wait(self.interval)
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._usage())
+
+
+def bench_pipeline(media_path: str, run_dir: Path, preset: str, duration: float) -> Dict[str, Any]:
+    """Edit the test clip end to end with one preset and collect the editor's run metrics"""
+    work_dir = run_dir / "work"
+    config = EditConfig(
+        input_video=media_path,
+        output_video=str(run_dir / "out" / "edited.mp4"),
+        **{**BENCH_BASE, **BENCH_PRESETS[preset]}
+    )
+    
+    logger.info(f"Benchmarking preset '{preset}'...")
+    with DiskMonitor(run_dir) as disk:
+        editor = VideoEditor(config, work_dir)
+        if not editor.run():
+            raise RuntimeError(f"Preset '{preset}' failed to edit {media_path}")
+    
+    metrics = editor.metrics.report(duration)
+    stages = metrics["stages"]
+    return {
+        "preset": preset,
+        "seconds": metrics["wall_seconds"],
+        "fps": duration * ZOOM_FPS / metrics["wall_seconds"] if metrics["wall_seconds"] else 0.0,
+        "realtime": metrics["realtime"],
+        # Input and output included: what a run needs free on disk
+        "disk_mb": disk.peak_bytes / (1024 * 1024),
+        # Largest child process (see RunMetrics.record_process)
+        "rss_mb": max((stage["peak_rss_mb"] for stage in stages.values()), default=0.0),
+        "stages": stages
+    }
+
+
+def bench_suite(work_root: Path, durations: List[float], resolutions: List[str],
+                presets: List[str]) -> List[Dict[str, Any]]:
+    """Every preset on every clip size: end to end numbers plus each run's per-stage figures"""
+    results = []
+    for resolution in resolutions:
+        for duration in durations:
+            media_dir = work_root / f"{resolution}_{duration:g}s"
+            media_dir.mkdir(parents=True, exist_ok=True)
+            media_path = media_dir / "test_media.mp4"
+            
+            logger.info(f"Generating {duration:g}s {resolution} test clip...")
+            generate_test_media(str(media_path), duration, resolution, pauses=True)
+            
+            for preset in presets:
+                run_dir = media_dir / preset
+                run_dir.mkdir()
+                # The clip counts towards the disk peak of the run
+                os.link(media_path, run_dir / media_path.name)
+                row = bench_pipeline(str(run_dir / media_path.name), run_dir, preset, duration)
+                results.append({"resolution": resolution, "duration": duration, **row})
+            
+            media_path.unlink()
+    return results
+
+
+def stage_rows(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten the per-stage figures of suite results for print_table"""
+    rows = []
+    for result in results:
+        for name, stage in result["stages"].items():
+            rows.append({
+                "resolution": result["resolution"],
+                "duration": result["duration"],
+                "preset": result["preset"],
+                "stage": name,
+                "seconds": stage["wall_seconds"],
+                "realtime": stage.get("realtime", 0.0),
+                "rss_mb": stage["peak_rss_mb"]
+            })
+    return rows
+
+
+def compare_results(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Realtime factor of each run next to the same run in a saved --json baseline"""
+    previous = {(row["resolution"], row["duration"], row["preset"]): row for row in baseline}
+    rows = []
+    for row in results:
+        before = previous.get((row["resolution"], row["duration"], row["preset"]))
+        if before is None:
+            continue
+        rows.append({
+            "resolution": row["resolution"],
+            "duration": row["duration"],
+            "preset": row["preset"],
+            "before": before["realtime"],
+            "after": row["realtime"],
+            "change_%": (row["realtime"] / before["realtime"] - 1.0) * 100 if before["realtime"] else 0.0
+        })
+    return rows
+
+
+def git_revision() -> Optional[str]:
+    """Commit the benchmark ran on, so saved results can be matched to it"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], check=True, capture_output=True,
+                                text=True, cwd=Path(__file__).parent)
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def print_table(title: str, rows: List[Dict], columns: List[str]):
+    """Print results as a fixed-width table"""
+    cells = [
+        [f"{row[col]:.2f}" if isinstance(row[col], float) else str(row[col]) for col in columns]
+        for row in rows
+    ]
+    widths = [max([10, len(col)] + [len(line[i]) for line in cells]) for i, col in enumerate(columns)]
+    
+    print()
+    print(title)
+    print("  ".join(f"{col:>{width}}" for col, width in zip(columns, widths)))
+    for line in cells:
+        print("  ".join(f"{cell:>{width}}" for cell, width in zip(line, widths)))
+    print()
+
+
+def main():
+    """CLI entrypoint"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark auto editor filters on synthetic media"
+    )
+    parser.add_argument(
+        '--zoom',
+        action='store_true',
+        help='Benchmark every zoom_mode and report fps'
+    )
+    parser.add_argument(
+        '--profiles',
+        action='store_true',
+        help='Calibrate encoding_profile: encode fps of every profile on this host'
+    )
+    parser.add_argument(
+        '--suite',
+        action='store_true',
+        help='Edit synthetic clips end to end with every preset and report per-stage figures'
+    )
+    parser.add_argument(
+        '--durations',
+        type=str,
+        default='10,30',
+        help='Comma separated clip lengths in seconds for --suite (default: 10,30)'
+    )
+    parser.add_argument(
+        '--resolutions',
+        type=str,
+        default='640x360,1280x720',
+        help='Comma separated clip sizes for --suite (default: 640x360,1280x720)'
+    )
+    parser.add_argument(
+        '--presets',
+        type=str,
+        default=','.join(BENCH_PRESETS),
+        help=f'Comma separated presets for --suite (default: {",".join(BENCH_PRESETS)})'
+    )
+    parser.add_argument(
+        '--json',
+        type=str,
+        help='Also save --suite results as JSON (to diff or --compare between commits)'
+    )
+    parser.add_argument(
+        '--compare',
+        type=str,
+        help='Saved --suite JSON to compare realtime factors against'
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=10.0,
+        help='Length of the synthetic test clip in seconds (default: 10)'
+    )
+    parser.add_argument(
+        '--resolution',
+        type=str,
+        default='1280x720',
+        help='Resolution of the synthetic test clip (default: 1280x720)'
+    )
+    
+    args = parser.parse_args()
+    
+    if not (args.zoom or args.profiles or args.suite):
+        parser.print_help()
+        return 1
+    
+    if args.suite:
+        presets = args.presets.split(',')
+        unknown = [preset for preset in presets if preset not in BENCH_PRESETS]
+        if unknown:
+            parser.error(f"unknown preset(s): {', '.join(unknown)} (choose from {', '.join(BENCH_PRESETS)})")
+        durations = [float(value) for value in args.durations.split(',')]
+        resolutions = args.resolutions.split(',')
+        
+        with tempfile.TemporaryDirectory(prefix="bench_edit_") as tmp:
+            results = bench_suite(Path(tmp), durations, resolutions, presets)
+        
+        print_table(
+            "End to end",
+            results,
+            ["resolution", "duration", "preset", "seconds", "fps", "realtime", "disk_mb", "rss_mb"]
+        )
+        print_table(
+            "Stages",
+            stage_rows(results),
+            ["resolution", "duration", "preset", "stage", "seconds", "realtime", "rss_mb"]
+        )
+        
+        if args.compare:
+            with open(args.compare, 'r') as f:
+                baseline = json.load(f)
+            print_table(
+                f"Realtime factor vs {args.compare} ({baseline.get('commit') or 'unknown commit'})",
+                compare_results(results, baseline["results"]),
+                ["resolution", "duration", "preset", "before", "after", "change_%"]
+            )
+        
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump({"commit": git_revision(), "results": results}, f, indent=2, sort_keys=True)
+            logger.info(f"Results saved: {args.json}")
+        
+        if not (args.zoom or args.profiles):
+            return 0
+    
+    with tempfile.TemporaryDirectory(prefix="bench_edit_") as tmp:
+        work_dir = Path(tmp)
+        media_path = str(work_dir / "test_media.mp4")
+        
+        logger.info(f"Generating {args.duration:.0f}s {args.resolution} test clip...")
+        generate_test_media(media_path, args.duration, args.resolution)
+        
+        if args.zoom:
+            results = bench_zoom_modes(media_path, work_dir, args.duration)
+            print_table(
+                f"Zoom modes ({args.resolution}, {args.duration:.0f}s)",
+                results,
+                ["mode", "seconds", "fps", "realtime"]
+            )
+        
+        if args.profiles:
+            results = bench_encoding_profiles(media_path, work_dir, args.duration)
+            print_table(
+                f"Encoding profiles ({args.resolution}, {args.duration:.0f}s)",
+                results,
+                ["profile", "stage", "seconds", "fps", "realtime", "size_mb"]
+            )
+            print(f"Suggested encoding_profile for this host: {recommend_profile(results, args.duration)}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
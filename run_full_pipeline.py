@@ -139,11 +139,9 @@ class PipelineOrchestrator:
             logger.info("Please create manifest.json with your editing settings")
             return False
         
-        # Clear state file to ensure fresh run (important for GitHub Actions)
-        state_file = self.project_root / "work" / "edit_state.json"
-        if state_file.exists():
-            state_file.unlink()
-            logger.info("🔄 Cleared previous editing state for fresh run")
+        # No state to clear here: without --resume, auto_edit.py starts the input's own
+        # work/<fingerprint>/ state fresh under its lock, and leaves other editors' state
+        # alone; cached stage artifacts in work/cache are kept, so unchanged stages are reused
         
         # Run auto_edit.py with auto-detection (no --resume to ensure all steps run)
         cmd = [
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Whisper Transcription Server
+Keeps Whisper models loaded between auto_edit.py runs, so each video skips
+the torch import and model load. auto_edit.py uses it automatically when it
+answers at whisper_server_url (manifest.json), and transcribes locally otherwise.
+
+Usage:
+    py whisper_server.py
+    py whisper_server.py --model small --port 8765
+"""
+
+import sys
+import json
+import argparse
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Any, Dict
+
+from auto_edit import WHISPER_OPTIONS
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class WhisperModels:
+    """Loaded Whisper models by name; one transcription at a time"""
+    
+    def __init__(self):
+        self.models: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+    
+    def load(self, name: str):
+        """Load a model unless it is already in memory"""
+        if name not in self.models:
+            import whisper
+            
+            logger.info(f"Loading Whisper model '{name}'...")
+            self.models[name] = whisper.load_model(name, device="cpu")
+        return self.models[name]
+    
+    def transcribe(self, audio_path: str, name: str) -> Dict[str, Any]:
+        """Transcribe a local audio file with the named model"""
+        with self.lock:
+            model = self.load(name)
+            result = model.transcribe(audio_path, **WHISPER_OPTIONS)
+        
+        segments = [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"].strip()}
+            for seg in result["segments"]
+        ]
+        return {"segments": segments, "text": result["text"].strip()}
+
+
+class TranscriptionHandler(BaseHTTPRequestHandler):
+    """GET /health, POST /transcribe {"audio_path": ..., "model": ...}"""
+    
+    models: WhisperModels = None
+    
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "models": sorted(self.models.models)})
+        else:
+            self._send_json(404, {"error": "not found"})
+    
+    def do_POST(self):
+        if self.path != "/transcribe":
+            self._send_json(404, {"error": "not found"})
+            return
+        
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            audio_path = request["audio_path"]
+            if not Path(audio_path).exists():
+                self._send_json(400, {"error": f"audio file not found: {audio_path}"})
+                return
+            
+            logger.info(f"Transcribing {audio_path}...")
+            self._send_json(200, self.models.transcribe(audio_path, request.get("model", "base")))
+        except Exception as e:
+            logger.warning(f"Transcription failed: {e}")
+            self._send_json(500, {"error": str(e)})
+    
+    def log_message(self, format, *args):
+        # Requests are logged by the handlers above
+        pass
+
+
+def main():
+    """CLI entrypoint"""
+    parser = argparse.ArgumentParser(
+        description="Keep Whisper loaded for auto_edit.py transcription"
+    )
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='base',
+        help='Whisper model to preload (default: base)'
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Address to listen on (default: 127.0.0.1, local only)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Port to listen on (default: 8765)'
+    )
+    
+    args = parser.parse_args()
+    
+    TranscriptionHandler.models = WhisperModels()
+    try:
+        TranscriptionHandler.models.load(args.model)
+    except ImportError:
+        logger.error("Whisper not installed. Install with: pip install openai-whisper")
+        return 1
+    
+    server = ThreadingHTTPServer((args.host, args.port), TranscriptionHandler)
+    logger.info(f"Whisper server listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
+    finally:
+        server.server_close()
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())